@@ -11,13 +11,15 @@
 #
 # See the Mulan PSL v2 for more details.
 
-from .filters import get_known_bugs, match_bug
-from typing import List, Optional, Set
+from .filters import get_known_bugs, compile_patterns, match_compiled
+from typing import Dict, List, Optional, Set
 
 class Filter:
     def __init__(self):
         self.registry = {}
         self.csr_blacklist: Set[str] = set()
+        # opcode -> compiled patterns applying to it, built on first sight
+        self._compiled: Dict[str, list] = {}
 
     def set_architecture(self, architecture: str) -> None:
         """
@@ -27,6 +29,7 @@ class Filter:
             architecture: Architecture name ('xs', 'nts', 'cva6', etc.)
         """
         self.registry, self.csr_blacklist = get_known_bugs(architecture)
+        self._compiled = {}
 
     def filter_known_bug(self, instr_op: str, source_values: List[int]) -> Optional[str]:
         """
@@ -51,7 +54,10 @@ class Filter:
             # source_values = [rs1_value, rs2_value]
             # Pattern matches if rs2_value == 0
         """
-        return match_bug(self.registry, instr_op, source_values)
+        patterns = self._compiled.get(instr_op)
+        if patterns is None:
+            patterns = self._compiled[instr_op] = compile_patterns(self.registry, instr_op)
+        return match_compiled(patterns, source_values)
 
     def is_csr_blacklisted(self, csr_name: str) -> bool:
         """
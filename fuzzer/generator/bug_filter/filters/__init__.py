@@ -19,6 +19,10 @@ from typing import Dict, List, Tuple, Optional, Set
 BugPattern = Tuple[Tuple[str, ...], str]
 Registry = Dict[str, List[BugPattern]]  # instr -> patterns
 
+# Pattern with numeric tokens parsed:
+# (required number of args, ((position, value), ...) to compare, bug_name)
+CompiledPattern = Tuple[int, Tuple[Tuple[int, int], ...], str]
+
 # CSR blacklist: Set of CSR names to filter out
 CSRBlacklist = Set[str]
 
@@ -150,6 +154,41 @@ def _match_instr(instr_op: str, pattern_instr: str) -> bool:
         return instr_op == pattern_instr
 
 
+def compile_patterns(registry: Registry, instr_op: str) -> List[CompiledPattern]:
+    """
+    Collect the patterns that apply to an instruction, ready for match_compiled
+
+    Exact-name patterns come first, then wildcard patterns in registry order
+    (the order match_bug tries them). Numeric tokens are parsed here once,
+    so matching only compares integers.
+    """
+    entries = list(registry.get(instr_op, ()))
+    for pattern_instr, pattern_list in registry.items():
+        if pattern_instr.endswith('*') and _match_instr(instr_op, pattern_instr):
+            entries.extend(pattern_list)
+    return [
+        (len(pattern), tuple((i, int(pat, 0)) for i, pat in enumerate(pattern) if pat != '*'), bug_name)
+        for pattern, bug_name in entries
+    ]
+
+
+def match_compiled(patterns: List[CompiledPattern], register_values: List[int]) -> Optional[str]:
+    """
+    Return the bug_name of the first compiled pattern matching the values
+    (same rules as _match_args), or None
+    """
+    num_values = len(register_values)
+    for required, checks, bug_name in patterns:
+        if num_values < required:
+            continue
+        for i, value in checks:
+            if register_values[i] != value:
+                break
+        else:
+            return bug_name
+    return None
+
+
 def match_bug(registry: Registry, instr_op: str, register_values: List[int]) -> Optional[str]:
     """
     Match an instruction line in the given registry:
@@ -157,23 +196,11 @@ def match_bug(registry: Registry, instr_op: str, register_values: List[int]) ->
       - Then tries wildcard match (patterns ending with '*')
       - If hits a (instr, parameter pattern), return its bug_name
       - Otherwise return None
-    """
-    # First, try exact match
-    patterns = registry.get(instr_op)
-    if patterns:
-        for pattern, bug_name in patterns:
-            if _match_args(register_values, pattern):
-                return bug_name
 
-    # Then, try wildcard match (iterate through all patterns)
-    for pattern_instr, pattern_list in registry.items():
-        if pattern_instr.endswith('*'):
-            if _match_instr(instr_op, pattern_instr):
-                for pattern, bug_name in pattern_list:
-                    if _match_args(register_values, pattern):
-                        return bug_name
-
-    return None
+    Repeated lookups should compile the patterns of each instruction once
+    (compile_patterns) and use match_compiled, as Filter does.
+    """
+    return match_compiled(compile_patterns(registry, instr_op), register_values)
 
 
 # ---------- Build and expose known_bugs for each architecture ----------
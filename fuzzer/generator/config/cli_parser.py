@@ -122,6 +122,12 @@ def create_parser():
         help='Disable FPR (floating-point registers) logging in debug output'
     )
 
+    # —— Encoder options ——
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='Disable the persistent instruction encode cache (~/.cache/divefuzz/rv_encode.sqlite)'
+    )
+
     return parser
 
 def parse_args():
@@ -74,6 +74,9 @@ class Config:
         self.debug_log_csr = not bool(args.debug_no_csr)
         self.debug_log_fpr = not bool(args.debug_no_fpr)
 
+        # --no-cache: skip the persistent encode cache (passed on to the workers)
+        self.encode_cache_enabled = not bool(args.no_cache)
+
         self.arch_bits = 32 if self.is_rv32 else 64
 
         # Build ISA string based on allowed_ext_name profile
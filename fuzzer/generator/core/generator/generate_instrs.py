@@ -80,6 +80,9 @@ def execute_sequence_with_checkpoint(
 
         # Confirm successful execution (clears checkpoint_set flag)
         spike_session.confirm_instruction()
+
+        # The sequence ran past the debug logger: its register baseline is stale
+        InstructionValidator.invalidate_debug_state()
         return True
 
     except Exception:
@@ -257,7 +260,8 @@ def generate_instructions(instr_number: int,
                           out_dir: str,
                           shared_xor_cache,  # Deprecated: kept for API compatibility
                           architecture: str,
-                          debug_config: dict = None):
+                          debug_config: dict = None,
+                          encode_cache: bool = True):
     """
     Generate random RISC-V instructions for a single seed.
 
@@ -272,6 +276,7 @@ def generate_instructions(instr_number: int,
         shared_xor_cache: (Deprecated) Not used - XOR cache is now per-process LOCAL mode
         architecture: Architecture for bug filtering ('xs', 'nts', 'rkt', 'kmh')
         debug_config: Debug configuration dict (see generate_instructions_parallel)
+        encode_cache: Use the persistent instruction encode cache
     """
     # Note: shared_xor_cache is no longer used (v4.0 architecture uses LOCAL XORCache)
 
@@ -304,7 +309,7 @@ def generate_instructions(instr_number: int,
                     xor_cache.create()
 
                     # Create validator with simplified architecture (v4.0)
-                    encoder = HybridEncoder(quiet=True)
+                    encoder = HybridEncoder(quiet=True, encode_cache=encode_cache)
                     validator = InstructionValidator(
                         spike_session=spike_session,
                         xor_cache=xor_cache,
@@ -352,7 +357,7 @@ def generate_instructions(instr_number: int,
         else:
             # Non-eliminate mode: still create encoder for offset calculation
             try:
-                encoder = HybridEncoder(quiet=True)
+                encoder = HybridEncoder(quiet=True, encode_cache=encode_cache)
             except Exception:
                 encoder = None
 
@@ -811,7 +816,6 @@ def generate_instructions(instr_number: int,
 
         # Disable debug output
         InstructionValidator.disable_debug_output()
-        InstructionValidator.disable_detailed_debug()
 
         # TODO: Count how many identical cases have been eliminated
         # print("resolve_duplicates:",resolve_duplicates,"\nresolve_duplicates_fail:",resolve_duplicates_fail)
@@ -832,6 +836,13 @@ def generate_instructions(instr_number: int,
             except Exception:
                 pass
 
+        # Close the detailed debug log here so buffered records are also written
+        # when generation fails (pool workers exit without flushing open files)
+        try:
+            InstructionValidator.disable_detailed_debug()
+        except Exception:
+            pass
+
         # Clean up temporary files in /dev/shm
         temp_file_manager.cleanup_all_temp_files()
 
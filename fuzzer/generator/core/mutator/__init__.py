@@ -30,7 +30,8 @@ def mutate_instructions_parallel(directory_path: Path,
                                  exclude_extensions: List[str],
                                  eliminate_enable: bool,
                                  arch: ArchConfig,
-                                 template_type: str):
+                                 template_type: str,
+                                 encode_cache: bool = True):
     """
     Mutate instructions in parallel across multiple processes.
 
@@ -45,6 +46,7 @@ def mutate_instructions_parallel(directory_path: Path,
         exclude_extensions: Extensions to exclude from mutation
         eliminate_enable: Enable conflict elimination via Spike
         arch: Architecture configuration for template creation
+        encode_cache: Use the persistent instruction encode cache in workers
     """
     if not os.path.exists(directory_path):
         raise FileNotFoundError(f"Error {directory_path} NOT exist!")
@@ -65,7 +67,8 @@ def mutate_instructions_parallel(directory_path: Path,
                 exclude_extensions,
                 eliminate_enable,
                 arch,
-                template_type
+                template_type,
+                encode_cache
             ) for file_path, content in processed_data.items()
         ]
 
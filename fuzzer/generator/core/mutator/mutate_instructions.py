@@ -36,6 +36,7 @@ from ...utils import list2str_without_indent
 from ...reg_analyzer.nop_template_gen import generate_nop_elf
 from ...reg_analyzer.spike_session import SpikeSession, SPIKE_ENGINE_AVAILABLE
 from ...reg_analyzer.instruction_validator import InstructionValidator
+from ...reg_analyzer.hybrid_encoder import HybridEncoder
 from ...config.config_manager import MAX_MUTATE_TIME
 from ...bug_filter import bug_filter
 
@@ -49,7 +50,8 @@ def process_content(file_path: str,
                     exclude_extensions: List[str],
                     eliminate_enable: bool,
                     arch: ArchConfig,
-                    template_type: str):
+                    template_type: str,
+                    encode_cache: bool = True):
     """
     Process and mutate instructions in a single file.
 
@@ -62,6 +64,7 @@ def process_content(file_path: str,
         exclude_extensions: Extensions to exclude from mutation
         eliminate_enable: Enable conflict elimination via Spike
         arch: Architecture configuration for template creation
+        encode_cache: Use the persistent instruction encode cache
     """
     # Create fresh template instance for this mutated file with random type and values
     template = create_template_instance(arch, template_type)
@@ -92,7 +95,10 @@ def process_content(file_path: str,
             )
 
             if spike_session.initialize():
-                validator = InstructionValidator(spike_session)
+                validator = InstructionValidator(
+                    spike_session,
+                    encoder=HybridEncoder(quiet=True, encode_cache=encode_cache)
+                )
             else:
                 spike_session = None
                 validator = None
@@ -76,7 +76,8 @@ def main():
             config.template_type,
             str(config.out_dir),
             config.architecture,
-            debug_config
+            debug_config,
+            config.encode_cache_enabled
         )
 
         # Write ISA info for downstream tools (e.g., spike runner)
@@ -92,7 +93,8 @@ def main():
             config.exclude_extensions,
             config.eliminate_enable,
             config.arch,
-            config.template_type
+            config.template_type,
+            config.encode_cache_enabled
         )
 
 
@@ -23,15 +23,15 @@ Supports pseudo-instructions that expand to multiple machine instructions:
 """
 
 import re
-from typing import List, Tuple, Union, Optional
+from typing import List, Tuple, Union, Optional, Set
 from dataclasses import dataclass
 
 try:
-    from .instruction_encoder import InstructionEncoder
-    from .riscv_compiler import RiscvCompiler
+    from .instruction_encoder import InstructionEncoder, UnsupportedInstructionError
+    from .riscv_compiler import RiscvCompiler, DEFAULT_CACHE_PATH
 except ImportError:
-    from instruction_encoder import InstructionEncoder
-    from riscv_compiler import RiscvCompiler
+    from instruction_encoder import InstructionEncoder, UnsupportedInstructionError
+    from riscv_compiler import RiscvCompiler, DEFAULT_CACHE_PATH
 
 
 @dataclass
@@ -55,7 +55,8 @@ class HybridEncoder:
     def __init__(
         self,
         march: str = "rv64imafdcv_zicsr_zifencei_zba_zbb_zbc_zbs_zfh",
-        quiet: bool = False
+        quiet: bool = False,
+        encode_cache: bool = True
     ):
         """
         Initialize the hybrid encoder
@@ -63,9 +64,13 @@ class HybridEncoder:
         Args:
             march: The schema string used by the compiler
             quiet: Silent mode, no information is printed
+            encode_cache: Use the compiler's persistent encode cache (--no-cache disables it)
         """
         self.encoder = InstructionEncoder()
-        self.compiler = RiscvCompiler(default_march=march)
+        self.compiler = RiscvCompiler(
+            default_march=march,
+            cache_path=DEFAULT_CACHE_PATH if encode_cache else None
+        )
         self.quiet = quiet
 
         self.stats = {
@@ -74,6 +79,33 @@ class HybridEncoder:
             'total_calls': 0 
         }
 
+        # Mnemonics the fast encoder has no definition for (pseudo-instructions
+        # such as li/la/mv): these go straight to the compiler
+        self._unsupported: Set[str] = set()
+
+    def _encode_fast(self, instruction: str) -> Tuple[Optional[int], Optional[Union[Exception, str]]]:
+        """
+        Try the fast encoder
+
+        An unsupported opcode is remembered, so later instructions with the
+        same mnemonic skip the attempt (and its exception) entirely.
+
+        Returns:
+            (machine_code, None) on success, (None, encoder_error) otherwise
+        """
+        tokens = instruction.split(None, 1)
+        mnemonic = tokens[0].lower() if tokens else ""
+        if mnemonic in self._unsupported:
+            return None, f"Unsupported instruction: '{mnemonic}'"
+        try:
+            return self.encoder.encode(instruction), None
+        except UnsupportedInstructionError as e:
+            if e.opcode == mnemonic:
+                self._unsupported.add(mnemonic)
+            return None, e
+        except ValueError as e:
+            return None, e
+
     def encode(self, instruction: str) -> int:
         """
         The encoding process for a single instruction is machine code:
@@ -93,14 +125,11 @@ class HybridEncoder:
         self.stats['total_calls'] += 1
 
         # Step 1: Try the encoder
-        encoder_error = None
-        try:
-            result = self.encoder.encode(instruction)
+        result, encoder_error = self._encode_fast(instruction)
+        if encoder_error is None:
             self.stats['encoder_success'] += 1
             return result
-        except ValueError as e:
-            # The encoder failed. Proceed to the fallback mechanism
-            encoder_error = e
+        # The encoder failed. Proceed to the fallback mechanism
 
         # Step 2: Compiler rollback
         try:
@@ -158,15 +187,12 @@ class HybridEncoder:
         self.stats['total_calls'] += 1
 
         # Step 1: Try fast encoder (only works for single real instructions)
-        encoder_error = None
-        try:
-            result = self.encoder.encode(instruction)
+        result, encoder_error = self._encode_fast(instruction)
+        if encoder_error is None:
             self.stats['encoder_success'] += 1
             # Fast encoder succeeded - return single instruction with size 4
             # (fast encoder doesn't support compressed instructions currently)
             return [(result, 4)]
-        except ValueError as e:
-            encoder_error = e
 
         # Step 2: Compiler fallback with sequence mode
         try:
@@ -33,6 +33,14 @@ except ImportError:
     from register_mapping import RegisterMapping
 
 
+class UnsupportedInstructionError(ValueError):
+    """Raised by InstructionEncoder.encode for opcodes without a definition"""
+
+    def __init__(self, message: str, opcode: str):
+        super().__init__(message)
+        self.opcode = opcode
+
+
 # ============================================================================
 # Context Provider Protocol
 # ============================================================================
@@ -681,14 +689,16 @@ class InstructionEncoder:
         Returns:
             Immediate value
         """
-        imm_str = imm_str.strip()
+        # int() itself ignores surrounding whitespace and accepts the 0x/0b
+        # prefix for its base, so only the prefix needs to be inspected
+        prefix = imm_str.lstrip()[:2]
 
         # Handle hexadecimal
-        if imm_str.startswith('0x') or imm_str.startswith('0X'):
+        if prefix == '0x' or prefix == '0X':
             return int(imm_str, 16)
 
         # Handle binary
-        if imm_str.startswith('0b') or imm_str.startswith('0B'):
+        if prefix == '0b' or prefix == '0B':
             return int(imm_str, 2)
 
         # Decimal (including negative numbers)
@@ -708,24 +718,20 @@ class InstructionEncoder:
         reg_str = reg_str.strip()
 
         # Check whether it is a floating-point register field
-        # Use field_name hint or detect from register name itself
         is_float_field = field_name.startswith('f') or 'f' in field_name.lower()
 
-        # Use RegisterMapping.is_float_register to correctly identify float registers
+        # Single fused lookup: 0-31 = integer register, 32-63 = float register.
+        # A float register name always wins; an integer name is only valid in
+        # an integer field.
         # Note: 'fp' (frame pointer) is an INTEGER register, not a float register!
-        if self.reg_mapper.is_float_register(reg_str):
-            is_float_field = True
-
-        # Use the correct method name
-        if is_float_field:
-            result = self.reg_mapper.fpr_name_to_num(reg_str)
-        else:
-            result = self.reg_mapper.xpr_name_to_num(reg_str)
-
-        if result is None:
-            raise ValueError(f"Invalid register '{reg_str}' for field '{field_name}'")
+        index = self.reg_mapper.register_index(reg_str)
+        if index is not None:
+            if index >= 32:
+                return index - 32
+            if not is_float_field:
+                return index
 
-        return result
+        raise ValueError(f"Invalid register '{reg_str}' for field '{field_name}'")
 
     def _encode_immediate_field(self, imm_value: int, field_name: str, encoding: str) -> int:
         """
@@ -868,7 +874,7 @@ class InstructionEncoder:
             error_msg += "\nFor unsupported instructions, consider:\n"
             error_msg += "- Using the fallback compiler (riscv-gnu-toolchain)\n"
             error_msg += "- Adding the instruction encoding manually\n"
-            raise ValueError(error_msg)
+            raise UnsupportedInstructionError(error_msg, original_opcode)
 
         instr_info = self.instr_dict[opcode_normalized]
         encoding = instr_info['encoding']
@@ -46,9 +46,6 @@ except ImportError:
     from spike_debug_logger import SpikeDebugLogger
     from bug_filter import bug_filter
 
-# FPR offset for register indexing (0-31 = XPR, 32-63 = FPR)
-FPR_OFFSET = 32
-
 
 class InstructionValidator:
     """
@@ -107,12 +104,6 @@ class InstructionValidator:
         if architecture:
             bug_filter.set_architecture(architecture)
 
-    def _read_register(self, reg_idx: int) -> int:
-        """Read register value by index (0-31: XPR, 32-63: FPR)."""
-        if reg_idx < 32:
-            return self.spike_session.get_xpr(reg_idx)
-        return self.spike_session.get_fpr(reg_idx - FPR_OFFSET)
-
     def _check_xor_unique(self, opcode: str, source_values: List[int]) -> Tuple[int, bool]:
         """
         Compute XOR and check uniqueness.
@@ -159,10 +150,9 @@ class InstructionValidator:
 
         # 2. Parse instruction
         opcode, source_regs, dest_regs, immediate = self.parser.parse_instruction_full(instruction)
-        actual_bytes = sum(size for _, size in instruction_seq)
 
         # 3. Read source values (read-only operation, no state change)
-        source_values = [self._read_register(r) for r in source_regs]
+        source_values = self.spike_session.read_registers(source_regs)
         if immediate is not None:
             source_values.append(immediate)
 
@@ -186,9 +176,8 @@ class InstructionValidator:
             if self._debug_logger_enabled and self._debug_logger:
                 self._debug_logger.capture_pre_state(self.spike_session)
 
-            # 7. Execute instruction
-            machine_codes = [mc for mc, _ in instruction_seq]
-            sizes = [sz for _, sz in instruction_seq]
+            # 7. Execute instruction (split codes and sizes in one pass)
+            machine_codes, sizes = map(list, zip(*instruction_seq))
             self.spike_session.execute_sequence(machine_codes, sizes)
 
             # 8. Log (after execution to see changes)
@@ -200,7 +189,7 @@ class InstructionValidator:
 
             # 9. Confirm
             self.spike_session.confirm_instruction()
-            return True, actual_bytes
+            return True, sum(sizes)
 
         except Exception as e:
             self._log_exception(instruction, e)
@@ -222,14 +211,19 @@ class InstructionValidator:
         immediate: Optional[int]
     ):
         """Log accepted instruction."""
+        log_detailed = bool(self._debug_logger_enabled and self._debug_logger)
+        log_legacy = bool(self._debug_enabled and self._debug_file)
+        if not (log_detailed or log_legacy):
+            return
+
         # Get trap information
         was_trapped = self.spike_session.was_last_execution_trapped()
         trap_handler_steps = self.spike_session.get_last_trap_handler_steps()
 
         # Detailed debug logger
-        if self._debug_logger_enabled and self._debug_logger:
+        if log_detailed:
             # Read destination register values after execution
-            dest_values = [self._read_register(r) for r in dest_regs] if dest_regs else []
+            dest_values = self.spike_session.read_registers(dest_regs) if dest_regs else []
 
             self._debug_logger.log_instruction(
                 spike_session=self.spike_session,
@@ -247,7 +241,7 @@ class InstructionValidator:
             )
 
         # Legacy debug file
-        if self._debug_enabled and self._debug_file:
+        if log_legacy:
             pc = self.spike_session.get_current_pc()
             f = self._debug_file
             trap_info = f" [TRAPPED: {trap_handler_steps} steps]" if was_trapped else ""
@@ -295,6 +289,12 @@ class InstructionValidator:
         )
         cls._debug_logger_enabled = True
 
+    @classmethod
+    def invalidate_debug_state(cls):
+        """Drop the detailed logger's register baseline after unlogged execution."""
+        if cls._debug_logger_enabled and cls._debug_logger:
+            cls._debug_logger.invalidate()
+
     @classmethod
     def disable_detailed_debug(cls):
         """Disable detailed debug logging."""
@@ -18,19 +18,24 @@ Generates ELF files with N nop instructions for spike_engine initialization.
 This replaces the cumulative compilation approach with a one-time template generation.
 """
 
+import hashlib
 import os
+import shutil
+import subprocess
 import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional
 
 try:
-    from ..asm_template_manager import TemplateInstance
+    from ..asm_template_manager import TemplateInstance, temp_file_manager
     from .elf_compiler import generate_elf
 except ImportError:
     # For standalone testing
     import sys
     sys.path.append(str(Path(__file__).parent.parent))
-    from asm_template_manager import TemplateInstance
+    from asm_template_manager import TemplateInstance, temp_file_manager
     from reg_analyzer.elf_compiler import generate_elf
 
 
@@ -38,6 +43,40 @@ except ImportError:
 # This is a module-level constant for easy access from other modules
 NOP_REDUNDANCY = 16
 
+# Built ELF images keyed by (isa, arch_bits, source digest), most recent last
+ELF_CACHE_SIZE = 64
+_elf_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+_elf_cache_lock = threading.Lock()
+
+# Per-thread scratch assembly file, kept open and rewritten in place
+_scratch = threading.local()
+
+
+def _write_scratch_asm(content: str) -> str:
+    """
+    Write assembly source to this thread's scratch file in /dev/shm
+
+    The file is opened and registered with temp_file_manager once per thread
+    and then truncated and rewritten for every template. It is reopened if
+    it was unlinked by cleanup_all_temp_files() or inherited across fork.
+
+    Returns:
+        Path of the scratch file
+    """
+    pid = os.getpid()
+    fh = getattr(_scratch, 'fh', None)
+    if fh is None or _scratch.pid != pid or os.fstat(fh.fileno()).st_nlink == 0:
+        path = f"/dev/shm/nop_template_{pid}_{threading.get_ident()}.S"
+        fh = open(path, 'w+')
+        temp_file_manager.register_temp_file(path)
+        _scratch.fh, _scratch.path, _scratch.pid = fh, path, pid
+
+    fh.seek(0)
+    fh.truncate()
+    fh.write(content)
+    fh.flush()
+    return _scratch.path
+
 
 class NopTemplateGenerator:
     """
@@ -111,10 +150,29 @@ class NopTemplateGenerator:
         if output_path is None:
             output_path = f"/dev/shm/template_{num_instrs}_{os.getpid()}.elf"
 
-        # Write assembly to temporary file
-        asm_path = output_path.replace('.elf', '.S')
-        with open(asm_path, 'w') as f:
-            f.write(complete_asm)
+        # Identical sources produce identical ELFs: reuse an earlier build
+        cache_key = (
+            self.template.isa,
+            self.template.arch_bits,
+            hashlib.blake2b(complete_asm.encode(), digest_size=16).digest()
+        )
+        with _elf_cache_lock:
+            elf_bytes = _elf_cache.get(cache_key)
+            if elf_bytes is not None:
+                _elf_cache.move_to_end(cache_key)
+        if elf_bytes is not None and not keep_asm:
+            with open(output_path, 'wb') as f:
+                f.write(elf_bytes)
+            return output_path
+
+        # Write assembly to a temporary file (the reused per-thread scratch
+        # file unless the assembly should be kept next to the ELF)
+        if keep_asm:
+            asm_path = output_path.replace('.elf', '.S')
+            with open(asm_path, 'w') as f:
+                f.write(complete_asm)
+        else:
+            asm_path = _write_scratch_asm(complete_asm)
 
         try:
             # Compile to ELF
@@ -130,16 +188,15 @@ class NopTemplateGenerator:
 
             # Copy to desired output path if different
             if elf_path != output_path:
-                import shutil
                 shutil.move(elf_path, output_path)
                 elf_path = output_path
 
-            # Clean up assembly file unless keep_asm is True
-            if not keep_asm:
-                try:
-                    os.remove(asm_path)
-                except:
-                    pass  # Ignore cleanup errors
+            with open(elf_path, 'rb') as f:
+                elf_bytes = f.read()
+            with _elf_cache_lock:
+                _elf_cache[cache_key] = elf_bytes
+                if len(_elf_cache) > ELF_CACHE_SIZE:
+                    _elf_cache.popitem(last=False)
 
             return elf_path
 
@@ -177,7 +234,6 @@ class NopTemplateGenerator:
 
         # Try to extract symbol address using objdump
         try:
-            import subprocess
             result = subprocess.run(
                 ['riscv64-unknown-elf-objdump', '-t', elf_path],
                 capture_output=True,
@@ -18,7 +18,9 @@ Provides utilities to convert register names (e.g., 'x1', 'ra', 'f0', 'fa0')
 to register numbers for use with SpikeEngine API.
 """
 
-from typing import Dict, List, Optional
+import sys
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Union
 
 # RISC-V Integer (XPR) Register Mapping
 # ABI names -> register numbers
@@ -51,6 +53,48 @@ _FPR_ABI_TO_NUM: Dict[str, int] = {
     "ft8": 28, "ft9": 29, "ft10": 30, "ft11": 31,
 }
 
+# Merged lookup tables: ABI names plus numeric x0-x31 / f0-f31 forms,
+# so a normalized name resolves with a single dict lookup.
+# Keys are interned so callers passing interned tokens hit the identity fast path.
+_XPR_ALL: Mapping[str, int] = MappingProxyType({
+    sys.intern(name): num
+    for name, num in {**_XPR_ABI_TO_NUM, **{f"x{i}": i for i in range(32)}}.items()
+})
+_FPR_ALL: Mapping[str, int] = MappingProxyType({
+    sys.intern(name): num
+    for name, num in {**_FPR_ABI_TO_NUM, **{f"f{i}": i for i in range(32)}}.items()
+})
+
+# All floating-point register names ('fp' is NOT among them - it is s0/x8)
+_FLOAT_NAMES = frozenset(_FPR_ALL)
+
+# Fused table for type-agnostic lookups: XPR -> 0-31, FPR -> 32-63
+# (same convention as the 0-31 = XPR, 32-63 = FPR register indices used elsewhere)
+_ALL_REGS: Mapping[str, int] = MappingProxyType(
+    {**_XPR_ALL, **{name: 32 + num for name, num in _FPR_ALL.items()}}
+)
+
+# Same names mapped straight to the 0-31 register number (bulk conversion fast path)
+_ALL_REG_NUMS: Mapping[str, int] = MappingProxyType(
+    {name: v & 31 for name, v in _ALL_REGS.items()}
+)
+
+
+def _normalize(reg_name: str) -> str:
+    """Slow path for names that are not already stripped and lower-case"""
+    return reg_name.strip().lower()
+
+
+def _numeric(reg_name: str, prefix: str) -> Optional[int]:
+    """
+    Parse non-canonical numeric forms such as 'x01' (canonical 'x0'-'x31'
+    are already in the lookup tables). Avoids exception-driven int() parsing.
+    """
+    if len(reg_name) >= 2 and reg_name[0] == prefix and reg_name[1:].isdecimal():
+        num = int(reg_name[1:])
+        return num if num <= 31 else None
+    return None
+
 
 class RegisterMapping:
     """Utility class for converting RISC-V register names to numbers"""
@@ -70,19 +114,14 @@ class RegisterMapping:
         Returns:
             Register number (0-31), or None if invalid
         """
-        reg_name = reg_name.strip().lower()
-
-        # Handle x0-x31 format
-        if reg_name.startswith('x'):
-            try:
-                num = int(reg_name[1:])
-                if 0 <= num <= 31:
-                    return num
-            except ValueError:
-                pass
-
-        # Handle ABI names
-        return _XPR_ABI_TO_NUM.get(reg_name)
+        num = _XPR_ALL.get(reg_name)
+        if num is not None:
+            return num
+        reg_name = _normalize(reg_name)
+        num = _XPR_ALL.get(reg_name)
+        if num is not None:
+            return num
+        return _numeric(reg_name, 'x')
 
     @staticmethod
     def fpr_name_to_num(reg_name: str) -> Optional[int]:
@@ -99,20 +138,14 @@ class RegisterMapping:
         Returns:
             Register number (0-31), or None if invalid
         """
-        reg_name = reg_name.strip().lower()
-
-        # Handle f0-f31 format
-        if reg_name.startswith('f') and len(reg_name) >= 2:
-            # Try numeric format first
-            try:
-                num = int(reg_name[1:])
-                if 0 <= num <= 31:
-                    return num
-            except ValueError:
-                pass
-
-        # Handle ABI names
-        return _FPR_ABI_TO_NUM.get(reg_name)
+        num = _FPR_ALL.get(reg_name)
+        if num is not None:
+            return num
+        reg_name = _normalize(reg_name)
+        num = _FPR_ALL.get(reg_name)
+        if num is not None:
+            return num
+        return _numeric(reg_name, 'f')
 
     @staticmethod
     def is_float_register(reg_name: str) -> bool:
@@ -132,26 +165,37 @@ class RegisterMapping:
         Returns:
             True if floating-point register, False otherwise
         """
-        reg_name = reg_name.strip().lower()
+        if reg_name in _FLOAT_NAMES:
+            return True
+        reg_name = _normalize(reg_name)
+        return reg_name in _FLOAT_NAMES or _numeric(reg_name, 'f') is not None
 
-        # IMPORTANT: 'fp' is an integer register (s0/x8 alias), not a float register!
-        if reg_name == 'fp':
-            return False
+    @staticmethod
+    def register_index(reg_name: str) -> Optional[int]:
+        """
+        Look up a register of either type in one step.
 
-        # Check if it's in the FPR ABI mapping (ft*, fs*, fa*)
-        if reg_name in _FPR_ABI_TO_NUM:
-            return True
+        The register type is a byproduct of the lookup, so callers do not need
+        a separate is_float_register() check.
 
-        # Check f0-f31 format: must be 'f' followed by a valid number
-        if reg_name.startswith('f') and len(reg_name) >= 2:
-            try:
-                num = int(reg_name[1:])
-                if 0 <= num <= 31:
-                    return True
-            except ValueError:
-                pass
+        Args:
+            reg_name: Register name (e.g., 'ft4', 't6', 'f01', 'sp')
 
-        return False
+        Returns:
+            0-31 for integer registers, 32-63 for floating-point registers,
+            or None if invalid
+        """
+        v = _ALL_REGS.get(reg_name)
+        if v is not None:
+            return v
+        reg_name = _normalize(reg_name)
+        v = _ALL_REGS.get(reg_name)
+        if v is not None:
+            return v
+        if reg_name[:1] == 'f':
+            num = _numeric(reg_name, 'f')
+            return None if num is None else 32 + num
+        return _numeric(reg_name, 'x')
 
     @staticmethod
     def convert_register_name_smart(reg_name: str) -> Optional[int]:
@@ -167,10 +211,16 @@ class RegisterMapping:
         Returns:
             Register number (0-31), or None if invalid
         """
-        if RegisterMapping.is_float_register(reg_name):
-            return RegisterMapping.fpr_name_to_num(reg_name)
-        else:
-            return RegisterMapping.xpr_name_to_num(reg_name)
+        v = _ALL_REGS.get(reg_name)
+        if v is not None:
+            return v & 31
+        reg_name = _normalize(reg_name)
+        v = _ALL_REGS.get(reg_name)
+        if v is not None:
+            return v & 31
+        if reg_name[:1] == 'f':
+            return _numeric(reg_name, 'f')
+        return _numeric(reg_name, 'x')
 
     @staticmethod
     def convert_register_names(reg_names: List[str], is_float: bool) -> Optional[List[int]]:
@@ -201,25 +251,36 @@ class RegisterMapping:
         return result
 
     @staticmethod
-    def convert_register_names_smart(reg_names: List[str]) -> Optional[List[int]]:
+    def convert_register_names_smart(reg_names: List[Union[str, int]]) -> Optional[List[int]]:
         """
         Convert a list of register names to register numbers (smart mode).
 
         Automatically detects each register's type based on its name,
         correctly handling mixed instructions like 'fsw ft4, 800(t6)'.
 
+        Entries that are already register numbers (int) are passed through.
+        For hot loops, pass ints or lower-case names interned with sys.intern()
+        so lookups skip normalization and string comparison.
+
         Args:
-            reg_names: List of register names
+            reg_names: List of register names or register numbers
 
         Returns:
             List of register numbers, or None if any conversion fails
         """
-        result = []
-        for reg_name in reg_names:
-            reg_num = RegisterMapping.convert_register_name_smart(reg_name)
-            if reg_num is None:
-                print(f"ERROR: Failed to convert register name '{reg_name}'")
-                return None
-            result.append(reg_num)
+        # Fast path: every entry is a normalized name, resolved by map() in C
+        result = list(map(_ALL_REG_NUMS.get, reg_names))
+        if None not in result:
+            return result
+
+        convert = RegisterMapping.convert_register_name_smart
+        result = [
+            reg_name if reg_name.__class__ is int else convert(reg_name)
+            for reg_name in reg_names
+        ]
+        if None in result:
+            bad = reg_names[result.index(None)]
+            print(f"ERROR: Failed to convert register name '{bad}'")
+            return None
 
         return result
@@ -21,39 +21,142 @@ Supports pseudo-instructions that expand to multiple machine instructions:
 - etc.
 """
 
+import hashlib
 import os
+import shutil
+import sqlite3
+import struct
 import subprocess
 import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, List, Tuple, Union
 
+try:
+    from . import rv_encoder
+except ImportError:
+    import rv_encoder
+
+# Persistent encode cache shared across fuzzer runs
+DEFAULT_CACHE_PATH = Path.home() / ".cache" / "divefuzz" / "rv_encode.sqlite"
+# Bounds of the encode cache: entries kept in RAM, rows kept on disk, and
+# new rows buffered per commit (random immediates rarely repeat)
+RAM_CACHE_SIZE = 65536
+DISK_CACHE_ROWS = 1_000_000
+CACHE_COMMIT_BATCH = 256
+
+# Fixed header of every scratch assembly file. `.option norvc` disables
+# compressed instructions so all instructions are 4 bytes for consistent layout
+_ASM_PREFIX = ".text\n.option norvc\n    "
+
+def read_text_section(obj_file: Union[str, Path]) -> bytes:
+    """
+    Read the raw bytes of the .text section from an ELF object file
+
+    Replaces `objcopy -O binary`: the objects produced for single instructions
+    have a trivial layout, so walking the section header table is enough and
+    saves one subprocess per compile.
+
+    Args:
+        obj_file: Path to the ELF object file (ELF32 or ELF64, little-endian)
+
+    Returns:
+        Contents of the .text section
+
+    Raises:
+        RuntimeError: If the file is not a little-endian ELF or has no .text
+    """
+    with open(obj_file, 'rb') as f:
+        data = f.read()
+
+    if len(data) < 16 or data[:4] != b'\x7fELF' or data[5] != 1:
+        raise RuntimeError(f"Not a little-endian ELF object file: {obj_file}")
+
+    if data[4] == 2:
+        # ELF64: e_shoff at 0x28, e_shentsize/e_shnum/e_shstrndx at 0x3a
+        shoff, = struct.unpack_from('<Q', data, 0x28)
+        shentsize, shnum, shstrndx = struct.unpack_from('<HHH', data, 0x3a)
+        sh_fmt = '<IIQQQQ'
+    else:
+        # ELF32: e_shoff at 0x20, e_shentsize/e_shnum/e_shstrndx at 0x2e
+        shoff, = struct.unpack_from('<I', data, 0x20)
+        shentsize, shnum, shstrndx = struct.unpack_from('<HHH', data, 0x2e)
+        sh_fmt = '<IIIIII'
+
+    # Each entry: (sh_name, sh_type, sh_flags, sh_addr, sh_offset, sh_size)
+    sections = [
+        struct.unpack_from(sh_fmt, data, shoff + i * shentsize)
+        for i in range(shnum)
+    ]
+    strtab_offset, strtab_size = sections[shstrndx][4], sections[shstrndx][5]
+    strtab = data[strtab_offset:strtab_offset + strtab_size]
+
+    for sh_name, _, _, _, sh_offset, sh_size in sections:
+        end = strtab.find(b'\x00', sh_name)
+        if strtab[sh_name:end] == b'.text':
+            return data[sh_offset:sh_offset + sh_size]
+
+    raise RuntimeError(f"No .text section found in {obj_file}")
+
 
 class RiscvCompiler:
     """Compile RISC-V instructions using riscv-gnu-toolchain"""
 
+    # Assembler commands already verified in this process -> hash of `--version` output
+    _verified: dict = {}
+
     def __init__(
         self,
         as_cmd: str = "riscv64-unknown-elf-as",
         objcopy_cmd: str = "riscv64-unknown-elf-objcopy",
-        default_march: str = "rv64imafdcv_zicsr_zifencei_zba_zbb_zbc_zbs_zfh"
+        default_march: str = "rv64imafdcv_zicsr_zifencei_zba_zbb_zbc_zbs_zfh",
+        cache_path: Optional[Union[str, Path]] = DEFAULT_CACHE_PATH
     ):
         """
         Initialize the compiler
 
         Args:
             as_cmd: Assembler command
-            objcopy_cmd: objcopy command
+            objcopy_cmd: objcopy command (unused; .text is read directly from the object)
             default_march: Default architecture string (supports as many extensions as possible)
+            cache_path: sqlite file for the persistent encode cache (None disables it)
         """
         self.as_cmd = as_cmd
         self.objcopy_cmd = objcopy_cmd
         self.default_march = default_march
 
+        # Keep intermediate files in RAM when tmpfs is available
+        self._tmpdir_root = '/dev/shm' if os.path.isdir('/dev/shm') else None
+        # One scratch directory per thread, reused across compile calls;
+        # entries are (pid, thread, directory) so each process only reaps its own
+        self._local = threading.local()
+        self._tmpdirs: List[Tuple[int, threading.Thread, str]] = []
+        self._tmpdirs_lock = threading.Lock()
+        # Thread pool of compile_multiple, kept for the compiler's lifetime so
+        # its threads (and their scratch directories) are reused across calls
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_key: Optional[Tuple[int, int]] = None
+
         # Verify toolchain availability
         self._verify_toolchain()
 
+        # Encode cache: RAM dict in front of an sqlite table opened on first use.
+        # Entries are keyed on the assembler version so toolchain upgrades
+        # invalidate them.
+        self._cache: dict = {}
+        self._cache_path = cache_path
+        self._cache_db = None
+        self._cache_pid = None
+        self._cache_lock = threading.Lock()
+        # Rows not yet written to disk, committed in batches (see _flush_cache)
+        self._cache_pending: List[Tuple[str, str, str, int]] = []
+        self._as_version = RiscvCompiler._verified[self.as_cmd]
+
     def _verify_toolchain(self):
-        """Verify if the RISC-V toolchain is available"""
+        """Verify if the RISC-V toolchain is available (once per assembler command)"""
+        if self.as_cmd in RiscvCompiler._verified:
+            return
         try:
             result = subprocess.run(
                 [self.as_cmd, "--version"],
@@ -63,6 +166,9 @@ class RiscvCompiler:
             )
             if result.returncode != 0:
                 raise RuntimeError(f"Assembler verification failed: {result.stderr}")
+            RiscvCompiler._verified[self.as_cmd] = hashlib.sha1(
+                result.stdout.encode()
+            ).hexdigest()
         except FileNotFoundError:
             raise RuntimeError(
                 f"RISC-V toolchain not found: {self.as_cmd}\n"
@@ -71,6 +177,165 @@ class RiscvCompiler:
         except subprocess.TimeoutExpired:
             raise RuntimeError(f"Assembler verification timed out")
 
+    def _scratch_files(self) -> Tuple[Path, Path]:
+        """
+        Return the (asm, obj) paths of this thread's scratch directory
+
+        The directory is created on first use and reused for every later
+        compile on the same thread (files are simply overwritten). Forked
+        children get their own directory so they never clobber the parent's.
+        """
+        local = self._local
+        pid = os.getpid()
+        if getattr(local, 'pid', None) != pid:
+            tmpdir = tempfile.mkdtemp(dir=self._tmpdir_root, prefix="rvcc_")
+            with self._tmpdirs_lock:
+                self._tmpdirs.append((pid, threading.current_thread(), tmpdir))
+            local.pid = pid
+            local.files = (Path(tmpdir) / "inst.s", Path(tmpdir) / "inst.o")
+        return local.files
+
+    def _reap_scratch(self, all_threads: bool = False):
+        """
+        Remove scratch directories of this process whose thread has exited
+
+        Directories inherited from a parent process are dropped from the list
+        without being deleted (the parent still owns them).
+
+        Args:
+            all_threads: Also remove directories of live threads (used by close())
+        """
+        pid = os.getpid()
+        with self._tmpdirs_lock:
+            keep = []
+            for entry in self._tmpdirs:
+                owner_pid, thread, tmpdir = entry
+                if owner_pid != pid:
+                    continue
+                if all_threads or not thread.is_alive():
+                    shutil.rmtree(tmpdir, ignore_errors=True)
+                else:
+                    keep.append(entry)
+            self._tmpdirs = keep
+
+    def _get_executor(self, workers: int) -> ThreadPoolExecutor:
+        """Return the compile_multiple thread pool, (re)creating it when needed"""
+        key = (os.getpid(), workers)
+        if self._executor_key != key:
+            # A pool inherited through fork has no threads in this process
+            if self._executor is not None and self._executor_key[0] == key[0]:
+                self._executor.shutdown(wait=True)
+            self._reap_scratch()
+            self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rvcc")
+            self._executor_key = key
+        return self._executor
+
+    def close(self):
+        """Flush the encode cache, stop the thread pool and remove this process's scratch directories"""
+        self._flush_cache()
+        if self._executor is not None and self._executor_key[0] == os.getpid():
+            self._executor.shutdown(wait=True)
+        self._executor = None
+        self._executor_key = None
+        self._reap_scratch(all_threads=True)
+        self._local = threading.local()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+    def _open_cache_db(self):
+        """
+        Open (or create) the sqlite cache; on any error the cache is disabled
+
+        WAL mode lets the forked workers read while one of them commits, and
+        the table is trimmed to the newest DISK_CACHE_ROWS rows.
+        """
+        try:
+            path = Path(self._cache_path)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            db = sqlite3.connect(str(path), timeout=5, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS enc ("
+                "inst TEXT, march TEXT, as_version TEXT, machine_code INTEGER, "
+                "PRIMARY KEY (inst, march, as_version))"
+            )
+            first, last = db.execute("SELECT MIN(rowid), MAX(rowid) FROM enc").fetchone()
+            if first is not None and last - first >= DISK_CACHE_ROWS:
+                db.execute("DELETE FROM enc WHERE rowid <= ?", (last - DISK_CACHE_ROWS,))
+            db.commit()
+        except (OSError, sqlite3.Error):
+            self._cache_path = None
+            return None
+        self._cache_db = db
+        self._cache_pid = os.getpid()
+        # Rows buffered by a parent process are the parent's to write
+        self._cache_pending = []
+        return db
+
+    def _cache_remember(self, key: Tuple[str, str], machine_code: int):
+        """Insert into the RAM cache, evicting the oldest entry when full"""
+        cache = self._cache
+        if len(cache) >= RAM_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[key] = machine_code
+
+    def _flush_cache(self):
+        """Write buffered rows to the sqlite cache in one transaction (best-effort)"""
+        with self._cache_lock:
+            if not self._cache_pending or self._cache_pid != os.getpid():
+                return
+            rows, self._cache_pending = self._cache_pending, []
+            try:
+                self._cache_db.executemany("INSERT OR IGNORE INTO enc VALUES (?, ?, ?, ?)", rows)
+                self._cache_db.commit()
+            except sqlite3.Error:
+                pass
+
+    def _cache_lookup(self, asm_instruction: str, march: str) -> Optional[int]:
+        """Look up a cached encoding, warming the RAM dict from disk on a miss"""
+        key = (asm_instruction, march)
+        machine_code = self._cache.get(key)
+        if machine_code is not None or self._cache_path is None:
+            return machine_code
+
+        with self._cache_lock:
+            # sqlite connections must not be shared with forked children
+            db = self._cache_db if self._cache_pid == os.getpid() else self._open_cache_db()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    "SELECT machine_code FROM enc WHERE inst=? AND march=? AND as_version=?",
+                    (asm_instruction, march, self._as_version)
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+
+        if row is not None:
+            machine_code = row[0]
+            self._cache_remember(key, machine_code)
+        return machine_code
+
+    def _cache_store(self, asm_instruction: str, march: str, machine_code: int):
+        """Record an encoding in RAM and queue it for the disk cache"""
+        self._cache_remember((asm_instruction, march), machine_code)
+        if self._cache_path is None:
+            return
+
+        with self._cache_lock:
+            db = self._cache_db if self._cache_pid == os.getpid() else self._open_cache_db()
+            if db is None:
+                return
+            self._cache_pending.append((asm_instruction, march, self._as_version, machine_code))
+            if len(self._cache_pending) < CACHE_COMMIT_BATCH:
+                return
+        self._flush_cache()
+
     def compile_instruction(
         self,
         asm_instruction: str,
@@ -92,75 +357,64 @@ class RiscvCompiler:
         if march is None:
             march = self.default_march
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            asm_file = Path(tmpdir) / "inst.s"
-            obj_file = Path(tmpdir) / "inst.o"
-            bin_file = Path(tmpdir) / "inst.bin"
-
-            # Write assembly file
-            # Use .option norvc to disable compressed instructions
-            # This ensures all instructions are 4 bytes for consistent layout
-            with open(asm_file, 'w') as f:
-                f.write(".text\n")
-                f.write(".option norvc\n")
-                f.write(f"    {asm_instruction}\n")
-
-            # Assemble
-            as_result = subprocess.run(
-                [self.as_cmd, f"-march={march}", "-o", str(obj_file), str(asm_file)],
-                capture_output=True,
-                text=True,
-                timeout=10
+        # Fast path: common RV64IM instructions are encoded without the toolchain
+        if rv_encoder.supports_march(march):
+            machine_code = rv_encoder.encode(asm_instruction)
+            if machine_code is not None:
+                return machine_code
+
+        machine_code = self._cache_lookup(asm_instruction, march)
+        if machine_code is not None:
+            return machine_code
+
+        asm_file, obj_file = self._scratch_files()
+
+        # Write assembly file
+        with open(asm_file, 'w') as f:
+            f.write(_ASM_PREFIX + asm_instruction + "\n")
+
+        # Assemble
+        as_result = subprocess.run(
+            [self.as_cmd, f"-march={march}", "-o", str(obj_file), str(asm_file)],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+
+        if as_result.returncode != 0:
+            # Try to extract more useful error information
+            error_msg = as_result.stderr.strip()
+            raise RuntimeError(
+                f"Failed to assemble instruction: '{asm_instruction}'\n"
+                f"Architecture: {march}\n"
+                f"Error: {error_msg}"
             )
 
-            if as_result.returncode != 0:
-                # Try to extract more useful error information
-                error_msg = as_result.stderr.strip()
-                raise RuntimeError(
-                    f"Failed to assemble instruction: '{asm_instruction}'\n"
-                    f"Architecture: {march}\n"
-                    f"Error: {error_msg}"
-                )
-
-            # Extract binary
-            objcopy_result = subprocess.run(
-                [self.objcopy_cmd, "-O", "binary", str(obj_file), str(bin_file)],
-                capture_output=True,
-                text=True,
-                timeout=10
+        # Extract .text directly from the object (no objcopy subprocess)
+        machine_code_bytes = read_text_section(obj_file)
+
+        if len(machine_code_bytes) == 0:
+            raise RuntimeError(
+                f"Invalid machine code length: 0 bytes\n"
+                f"Failed to generate machine code for instruction"
             )
 
-            if objcopy_result.returncode != 0:
-                raise RuntimeError(
-                    f"Failed to extract binary from object file\n"
-                    f"Error: {objcopy_result.stderr}"
-                )
-
-            # Read machine code
-            with open(bin_file, 'rb') as f:
-                machine_code_bytes = f.read()
-
-            if len(machine_code_bytes) == 0:
-                raise RuntimeError(
-                    f"Invalid machine code length: 0 bytes\n"
-                    f"Failed to generate machine code for instruction"
-                )
-
-            # Handle compressed instructions (2 bytes) and standard instructions (4 bytes)
-            if len(machine_code_bytes) == 2:
-                # Compressed instruction (C extension): zero-pad to 4 bytes
-                # Spike will correctly execute 2-byte instructions, ignoring the trailing zero padding
-                machine_code_bytes = machine_code_bytes + b'\x00\x00'
-            elif len(machine_code_bytes) < 2:
-                raise RuntimeError(
-                    f"Invalid machine code length: {len(machine_code_bytes)} bytes\n"
-                    f"Expected at least 2 bytes for a RISC-V instruction"
-                )
-
-            # Convert to integer (little-endian), using the first 4 bytes
-            machine_code = int.from_bytes(machine_code_bytes[:4], byteorder='little')
+        # Handle compressed instructions (2 bytes) and standard instructions (4 bytes)
+        if len(machine_code_bytes) == 2:
+            # Compressed instruction (C extension): zero-pad to 4 bytes
+            # Spike will correctly execute 2-byte instructions, ignoring the trailing zero padding
+            machine_code_bytes = machine_code_bytes + b'\x00\x00'
+        elif len(machine_code_bytes) < 2:
+            raise RuntimeError(
+                f"Invalid machine code length: {len(machine_code_bytes)} bytes\n"
+                f"Expected at least 2 bytes for a RISC-V instruction"
+            )
 
-            return machine_code
+        # Convert to integer (little-endian), using the first 4 bytes
+        machine_code = int.from_bytes(machine_code_bytes[:4], byteorder='little')
+
+        self._cache_store(asm_instruction, march, machine_code)
+        return machine_code
 
     def compile_instruction_sequence(
         self,
@@ -192,116 +446,143 @@ class RiscvCompiler:
         if march is None:
             march = self.default_march
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            asm_file = Path(tmpdir) / "inst.s"
-            obj_file = Path(tmpdir) / "inst.o"
-            bin_file = Path(tmpdir) / "inst.bin"
-
-            # Write assembly file
-            # Use .option norvc to disable compressed instructions
-            # This ensures all instructions are 4 bytes for consistent layout
-            with open(asm_file, 'w') as f:
-                f.write(".text\n")
-                f.write(".option norvc\n")
-                f.write(f"    {asm_instruction}\n")
-
-            # Assemble
-            as_result = subprocess.run(
-                [self.as_cmd, f"-march={march}", "-o", str(obj_file), str(asm_file)],
-                capture_output=True,
-                text=True,
-                timeout=10
+        # Fast path: `li` and table instructions are expanded/encoded without the toolchain
+        if rv_encoder.supports_march(march):
+            sequence = rv_encoder.encode_sequence(asm_instruction)
+            if sequence is not None:
+                return sequence
+
+        asm_file, obj_file = self._scratch_files()
+
+        # Write assembly file
+        with open(asm_file, 'w') as f:
+            f.write(_ASM_PREFIX + asm_instruction + "\n")
+
+        # Assemble
+        as_result = subprocess.run(
+            [self.as_cmd, f"-march={march}", "-o", str(obj_file), str(asm_file)],
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+
+        if as_result.returncode != 0:
+            error_msg = as_result.stderr.strip()
+            raise RuntimeError(
+                f"Failed to assemble instruction: '{asm_instruction}'\n"
+                f"Architecture: {march}\n"
+                f"Error: {error_msg}"
             )
 
-            if as_result.returncode != 0:
-                error_msg = as_result.stderr.strip()
-                raise RuntimeError(
-                    f"Failed to assemble instruction: '{asm_instruction}'\n"
-                    f"Architecture: {march}\n"
-                    f"Error: {error_msg}"
-                )
-
-            # Extract binary
-            objcopy_result = subprocess.run(
-                [self.objcopy_cmd, "-O", "binary", str(obj_file), str(bin_file)],
-                capture_output=True,
-                text=True,
-                timeout=10
+        # Extract .text directly from the object (no objcopy subprocess)
+        machine_code_bytes = read_text_section(obj_file)
+
+        if len(machine_code_bytes) == 0:
+            raise RuntimeError(
+                f"Invalid machine code length: 0 bytes\n"
+                f"Failed to generate machine code for instruction"
             )
 
-            if objcopy_result.returncode != 0:
-                raise RuntimeError(
-                    f"Failed to extract binary from object file\n"
-                    f"Error: {objcopy_result.stderr}"
-                )
-
-            # Read all machine code bytes
-            with open(bin_file, 'rb') as f:
-                machine_code_bytes = f.read()
-
-            if len(machine_code_bytes) == 0:
-                raise RuntimeError(
-                    f"Invalid machine code length: 0 bytes\n"
-                    f"Failed to generate machine code for instruction"
-                )
-
-            # Parse all instructions from the binary
-            instructions = []
-            offset = 0
-
-            while offset < len(machine_code_bytes):
-                # Check if this is a compressed instruction (C extension)
-                # Compressed instructions have bits [1:0] != 11
-                first_halfword = int.from_bytes(
-                    machine_code_bytes[offset:offset+2],
-                    byteorder='little'
-                )
-
-                if (first_halfword & 0x3) != 0x3:
-                    # Compressed instruction (2 bytes)
-                    # Zero-pad to 4 bytes for consistency
-                    machine_code = first_halfword
-                    instructions.append((machine_code, 2))
-                    offset += 2
+        # Parse all instructions from the binary
+        instructions = []
+        offset = 0
+
+        while offset < len(machine_code_bytes):
+            # Check if this is a compressed instruction (C extension)
+            # Compressed instructions have bits [1:0] != 11
+            first_halfword = int.from_bytes(
+                machine_code_bytes[offset:offset+2],
+                byteorder='little'
+            )
+
+            if (first_halfword & 0x3) != 0x3:
+                # Compressed instruction (2 bytes)
+                # Zero-pad to 4 bytes for consistency
+                machine_code = first_halfword
+                instructions.append((machine_code, 2))
+                offset += 2
+            else:
+                # Standard instruction (4 bytes)
+                if offset + 4 <= len(machine_code_bytes):
+                    machine_code = int.from_bytes(
+                        machine_code_bytes[offset:offset+4],
+                        byteorder='little'
+                    )
+                    instructions.append((machine_code, 4))
+                    offset += 4
                 else:
-                    # Standard instruction (4 bytes)
-                    if offset + 4 <= len(machine_code_bytes):
-                        machine_code = int.from_bytes(
-                            machine_code_bytes[offset:offset+4],
-                            byteorder='little'
-                        )
-                        instructions.append((machine_code, 4))
-                        offset += 4
-                    else:
-                        # Incomplete instruction at end (shouldn't happen normally)
-                        remaining = machine_code_bytes[offset:]
-                        padded = remaining + b'\x00' * (4 - len(remaining))
-                        machine_code = int.from_bytes(padded, byteorder='little')
-                        instructions.append((machine_code, len(remaining)))
-                        break
-
-            return instructions
+                    # Incomplete instruction at end (shouldn't happen normally)
+                    remaining = machine_code_bytes[offset:]
+                    padded = remaining + b'\x00' * (4 - len(remaining))
+                    machine_code = int.from_bytes(padded, byteorder='little')
+                    instructions.append((machine_code, len(remaining)))
+                    break
+
+        return instructions
 
     def compile_multiple(
         self,
         instructions: list[str],
-        march: Optional[str] = None
+        march: Optional[str] = None,
+        workers: Optional[int] = None
     ) -> list[int]:
         """
         Batch compile multiple instructions
 
+        Each distinct instruction is compiled once. Assembler invocations are
+        independent, so they are fanned out over a thread pool (the GIL is
+        released while waiting on the subprocess). The pool is kept across
+        calls until close(). Result order matches input.
+
         Args:
             instructions: List of instructions
             march: Optional architecture string
+            workers: Number of worker threads (default: os.cpu_count(); 1 = serial)
 
         Returns:
             List of machine codes
         """
-        results = []
-        for instruction in instructions:
-            machine_code = self.compile_instruction(instruction, march)
-            results.append(machine_code)
-        return results
+        unique = list(dict.fromkeys(instructions))
+
+        if workers == 1 or len(unique) <= 1:
+            codes = {inst: self.compile_instruction(inst, march) for inst in unique}
+        else:
+            executor = self._get_executor(workers or os.cpu_count())
+            results = executor.map(lambda inst: self.compile_instruction(inst, march), unique)
+            codes = dict(zip(unique, results))
+
+        return [codes[inst] for inst in instructions]
+
+    def compile_multiple_bytes(
+        self,
+        instructions: list[str],
+        march: Optional[str] = None,
+        workers: Optional[int] = None
+    ) -> bytes:
+        """
+        Batch compile multiple instructions into a contiguous little-endian buffer
+
+        Each instruction occupies 4 bytes (compressed encodings are zero-padded,
+        as in compile_instruction). Use `struct.iter_unpack('<I', buf)` to
+        recover individual machine codes.
+
+        Args:
+            instructions: List of instructions
+            march: Optional architecture string
+            workers: Number of worker threads (see compile_multiple)
+
+        Returns:
+            Machine codes packed as bytes (4 * len(instructions) bytes)
+        """
+        codes = self.compile_multiple(instructions, march, workers)
+        buf = bytearray(len(codes) * 4)
+        for i, machine_code in enumerate(codes):
+            struct.pack_into('<I', buf, i * 4, machine_code)
+        return bytes(buf)
+
+
+# Compilers created by the convenience function, keyed by march
+_compilers: dict = {}
 
 
 # Convenience function
@@ -319,7 +600,9 @@ def compile_instruction(
     Returns:
         Machine code
     """
-    compiler = RiscvCompiler(default_march=march)
+    compiler = _compilers.get(march)
+    if compiler is None:
+        compiler = _compilers[march] = RiscvCompiler(default_march=march)
     return compiler.compile_instruction(instruction)
 
 
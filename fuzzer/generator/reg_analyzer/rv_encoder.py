@@ -0,0 +1,482 @@
+# Copyright (c) 2024-2025 Institute of Information Engineering, Chinese Academy of Sciences
+#
+# DiveFuzz is licensed under Mulan PSL v2.
+# You can use this software according to the terms and conditions of the Mulan PSL v2.
+# You may obtain a copy of Mulan PSL v2 at:
+#          http://license.coscl.org.cn/MulanPSL2
+#
+# THIS SOFTWARE IS PROVIDED ON AN "AS IS" BASIS, WITHOUT WARRANTIES OF ANY KIND,
+# EITHER EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO NON-INFRINGEMENT,
+# MERCHANTABILITY OR FIT FOR A PARTICULAR PURPOSE.
+#
+# See the Mulan PSL v2 for more details.
+
+"""
+Table-driven RV64I/M encoder
+
+Encodes the most common integer instructions arithmetically so RiscvCompiler
+can skip the assembler subprocess for them. Anything outside the table (or
+with operands the table cannot represent exactly) returns None and the caller
+falls back to riscv-gnu-toolchain.
+
+Supported formats:
+- R: add x1, x2, x3
+- I: addi x1, x2, -5 / slli x1, x2, 3
+- L: ld x1, 8(x2)
+- S: sd x1, 8(x2)
+- B: beq x1, x2, . + 8 (PC-relative offset syntax only)
+- U: lui x1, 0x12345
+- J: jal x1, . - 16 (PC-relative offset syntax only)
+
+Pseudo-instructions (encode_sequence only):
+- li x1, 0x123456789 (expanded exactly like GNU as, RV64)
+"""
+
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    from .register_mapping import RegisterMapping
+except ImportError:
+    from register_mapping import RegisterMapping
+
+
+# ============================================================================
+# Format Encoders
+# ============================================================================
+
+def encode_r(funct7: int, rs2: int, rs1: int, funct3: int, rd: int, opcode: int) -> int:
+    """Encode an R-type instruction"""
+    return (funct7 << 25) | (rs2 << 20) | (rs1 << 15) | (funct3 << 12) | (rd << 7) | opcode
+
+
+def encode_i(imm: int, rs1: int, funct3: int, rd: int, opcode: int) -> int:
+    """Encode an I-type instruction (imm is the signed 12-bit immediate)"""
+    return ((imm & 0xFFF) << 20) | (rs1 << 15) | (funct3 << 12) | (rd << 7) | opcode
+
+
+def encode_s(imm: int, rs2: int, rs1: int, funct3: int, opcode: int) -> int:
+    """Encode an S-type instruction (imm is the signed 12-bit offset)"""
+    imm &= 0xFFF
+    return (((imm >> 5) << 25) | (rs2 << 20) | (rs1 << 15) | (funct3 << 12)
+            | ((imm & 0x1F) << 7) | opcode)
+
+
+def encode_b(imm: int, rs2: int, rs1: int, funct3: int, opcode: int) -> int:
+    """Encode a B-type instruction (imm is the signed 13-bit byte offset)"""
+    imm &= 0x1FFF
+    return ((((imm >> 12) & 0x1) << 31) | (((imm >> 5) & 0x3F) << 25)
+            | (rs2 << 20) | (rs1 << 15) | (funct3 << 12)
+            | (((imm >> 1) & 0xF) << 8) | (((imm >> 11) & 0x1) << 7) | opcode)
+
+
+def encode_u(imm: int, rd: int, opcode: int) -> int:
+    """Encode a U-type instruction (imm is the 20-bit upper immediate)"""
+    return ((imm & 0xFFFFF) << 12) | (rd << 7) | opcode
+
+
+def encode_j(imm: int, rd: int, opcode: int) -> int:
+    """Encode a J-type instruction (imm is the signed 21-bit byte offset)"""
+    imm &= 0x1FFFFF
+    return ((((imm >> 20) & 0x1) << 31) | (((imm >> 1) & 0x3FF) << 21)
+            | (((imm >> 11) & 0x1) << 20) | (((imm >> 12) & 0xFF) << 12)
+            | (rd << 7) | opcode)
+
+
+# ============================================================================
+# Mnemonic Table
+# ============================================================================
+
+_OP = 0b0110011
+_OP_32 = 0b0111011
+_OP_IMM = 0b0010011
+_OP_IMM_32 = 0b0011011
+_LOAD = 0b0000011
+_STORE = 0b0100011
+_BRANCH = 0b1100011
+_LUI = 0b0110111
+
+# mnemonic -> (format, *fixed fields)
+#   'R':  (funct7, funct3, opcode)
+#   'I':  (funct3, opcode)
+#   'SH': (funct6/funct7 upper bits, funct3, opcode, shamt width)
+#   'L':  (funct3, opcode)
+#   'S':  (funct3, opcode)
+#   'B':  (funct3, opcode)
+#   'U':  (opcode,)
+#   'J':  (opcode,)
+MNEMONIC_TABLE: Dict[str, Tuple] = {
+    # RV64I register-register
+    'add':  ('R', 0b0000000, 0b000, _OP),
+    'sub':  ('R', 0b0100000, 0b000, _OP),
+    'sll':  ('R', 0b0000000, 0b001, _OP),
+    'slt':  ('R', 0b0000000, 0b010, _OP),
+    'sltu': ('R', 0b0000000, 0b011, _OP),
+    'xor':  ('R', 0b0000000, 0b100, _OP),
+    'srl':  ('R', 0b0000000, 0b101, _OP),
+    'sra':  ('R', 0b0100000, 0b101, _OP),
+    'or':   ('R', 0b0000000, 0b110, _OP),
+    'and':  ('R', 0b0000000, 0b111, _OP),
+    'addw': ('R', 0b0000000, 0b000, _OP_32),
+    'subw': ('R', 0b0100000, 0b000, _OP_32),
+    'sllw': ('R', 0b0000000, 0b001, _OP_32),
+    'srlw': ('R', 0b0000000, 0b101, _OP_32),
+    'sraw': ('R', 0b0100000, 0b101, _OP_32),
+
+    # RV64M
+    'mul':    ('R', 0b0000001, 0b000, _OP),
+    'mulh':   ('R', 0b0000001, 0b001, _OP),
+    'mulhsu': ('R', 0b0000001, 0b010, _OP),
+    'mulhu':  ('R', 0b0000001, 0b011, _OP),
+    'div':    ('R', 0b0000001, 0b100, _OP),
+    'divu':   ('R', 0b0000001, 0b101, _OP),
+    'rem':    ('R', 0b0000001, 0b110, _OP),
+    'remu':   ('R', 0b0000001, 0b111, _OP),
+    'mulw':   ('R', 0b0000001, 0b000, _OP_32),
+    'divw':   ('R', 0b0000001, 0b100, _OP_32),
+    'divuw':  ('R', 0b0000001, 0b101, _OP_32),
+    'remw':   ('R', 0b0000001, 0b110, _OP_32),
+    'remuw':  ('R', 0b0000001, 0b111, _OP_32),
+
+    # RV64I register-immediate
+    'addi':  ('I', 0b000, _OP_IMM),
+    'slti':  ('I', 0b010, _OP_IMM),
+    'sltiu': ('I', 0b011, _OP_IMM),
+    'xori':  ('I', 0b100, _OP_IMM),
+    'ori':   ('I', 0b110, _OP_IMM),
+    'andi':  ('I', 0b111, _OP_IMM),
+    'addiw': ('I', 0b000, _OP_IMM_32),
+
+    # Shifts by immediate (RV64: 6-bit shamt, W-forms: 5-bit shamt)
+    'slli':  ('SH', 0b000000, 0b001, _OP_IMM, 6),
+    'srli':  ('SH', 0b000000, 0b101, _OP_IMM, 6),
+    'srai':  ('SH', 0b010000, 0b101, _OP_IMM, 6),
+    'slliw': ('SH', 0b0000000, 0b001, _OP_IMM_32, 5),
+    'srliw': ('SH', 0b0000000, 0b101, _OP_IMM_32, 5),
+    'sraiw': ('SH', 0b0100000, 0b101, _OP_IMM_32, 5),
+
+    # Loads
+    'lb':  ('L', 0b000, _LOAD),
+    'lh':  ('L', 0b001, _LOAD),
+    'lw':  ('L', 0b010, _LOAD),
+    'ld':  ('L', 0b011, _LOAD),
+    'lbu': ('L', 0b100, _LOAD),
+    'lhu': ('L', 0b101, _LOAD),
+    'lwu': ('L', 0b110, _LOAD),
+
+    # Stores
+    'sb': ('S', 0b000, _STORE),
+    'sh': ('S', 0b001, _STORE),
+    'sw': ('S', 0b010, _STORE),
+    'sd': ('S', 0b011, _STORE),
+
+    # Branches
+    'beq':  ('B', 0b000, _BRANCH),
+    'bne':  ('B', 0b001, _BRANCH),
+    'blt':  ('B', 0b100, _BRANCH),
+    'bge':  ('B', 0b101, _BRANCH),
+    'bltu': ('B', 0b110, _BRANCH),
+    'bgeu': ('B', 0b111, _BRANCH),
+
+    # Upper immediates and jumps
+    'lui':   ('U', _LUI),
+    'auipc': ('U', 0b0010111),
+    'jal':   ('J', 0b1101111),
+}
+
+
+# ============================================================================
+# Operand Parsing
+# ============================================================================
+
+# One precompiled operand pattern per format (operands only, mnemonic stripped)
+_REG = r'\s*(\w+)\s*'
+_IMM = r'\s*([-+]?\w+)\s*'
+_PCREL = r'\s*\.\s*([-+])\s*(\w+)\s*'
+_MEM = r'\s*([-+]?\w*)\s*\(\s*(\w+)\s*\)\s*'
+
+_R_RE = re.compile(f'{_REG},{_REG},{_REG}$')
+_I_RE = re.compile(f'{_REG},{_REG},{_IMM}$')
+_M_RE = re.compile(f'{_REG},{_MEM}$')
+_B_RE = re.compile(f'{_REG},{_REG},{_PCREL}$')
+_U_RE = re.compile(f'{_REG},{_IMM}$')
+_J_RE = re.compile(f'{_REG},{_PCREL}$')
+
+
+def _reg(name: str) -> Optional[int]:
+    """Integer register number, or None if not an XPR name"""
+    return RegisterMapping.xpr_name_to_num(name)
+
+
+@lru_cache(maxsize=4096)
+def _imm(token: str) -> Optional[int]:
+    """Parse an immediate the way GNU as would for plain integers"""
+    try:
+        return int(token, 0)
+    except ValueError:
+        return None
+
+
+def _fits_signed(value: int, bits: int) -> bool:
+    return -(1 << (bits - 1)) <= value < (1 << (bits - 1))
+
+
+# ============================================================================
+# Per-Format Encoders (operand string -> machine code or None)
+# ============================================================================
+
+def _encode_r_ops(entry: Tuple, ops: str) -> Optional[int]:
+    m = _R_RE.match(ops)
+    if m is None:
+        return None
+    rd, rs1, rs2 = _reg(m[1]), _reg(m[2]), _reg(m[3])
+    if rd is None or rs1 is None or rs2 is None:
+        return None
+    _, funct7, funct3, opcode = entry
+    return encode_r(funct7, rs2, rs1, funct3, rd, opcode)
+
+
+def _encode_i_ops(entry: Tuple, ops: str) -> Optional[int]:
+    m = _I_RE.match(ops)
+    if m is None:
+        return None
+    rd, rs1, imm = _reg(m[1]), _reg(m[2]), _imm(m[3])
+    if rd is None or rs1 is None or imm is None or not _fits_signed(imm, 12):
+        return None
+    _, funct3, opcode = entry
+    return encode_i(imm, rs1, funct3, rd, opcode)
+
+
+def _encode_sh_ops(entry: Tuple, ops: str) -> Optional[int]:
+    m = _I_RE.match(ops)
+    if m is None:
+        return None
+    rd, rs1, shamt = _reg(m[1]), _reg(m[2]), _imm(m[3])
+    _, funct_hi, funct3, opcode, shamt_bits = entry
+    if rd is None or rs1 is None or shamt is None or not 0 <= shamt < (1 << shamt_bits):
+        return None
+    return encode_i((funct_hi << shamt_bits) | shamt, rs1, funct3, rd, opcode)
+
+
+def _encode_mem_ops(entry: Tuple, ops: str) -> Optional[int]:
+    m = _M_RE.match(ops)
+    if m is None:
+        return None
+    reg, rs1 = _reg(m[1]), _reg(m[3])
+    imm = _imm(m[2]) if m[2] else 0
+    if reg is None or rs1 is None or imm is None or not _fits_signed(imm, 12):
+        return None
+    fmt, funct3, opcode = entry
+    if fmt == 'L':
+        return encode_i(imm, rs1, funct3, reg, opcode)
+    return encode_s(imm, reg, rs1, funct3, opcode)
+
+
+def _encode_b_ops(entry: Tuple, ops: str) -> Optional[int]:
+    m = _B_RE.match(ops)
+    if m is None:
+        return None
+    rs1, rs2, offset = _reg(m[1]), _reg(m[2]), _imm(m[4])
+    if rs1 is None or rs2 is None or offset is None:
+        return None
+    if m[3] == '-':
+        offset = -offset
+    if offset & 1 or not _fits_signed(offset, 13):
+        return None
+    _, funct3, opcode = entry
+    return encode_b(offset, rs2, rs1, funct3, opcode)
+
+
+def _encode_u_ops(entry: Tuple, ops: str) -> Optional[int]:
+    m = _U_RE.match(ops)
+    if m is None:
+        return None
+    rd, imm = _reg(m[1]), _imm(m[2])
+    if rd is None or imm is None or not 0 <= imm <= 0xFFFFF:
+        return None
+    return encode_u(imm, rd, entry[1])
+
+
+def _encode_j_ops(entry: Tuple, ops: str) -> Optional[int]:
+    m = _J_RE.match(ops)
+    if m is None:
+        return None
+    rd, offset = _reg(m[1]), _imm(m[3])
+    if rd is None or offset is None:
+        return None
+    if m[2] == '-':
+        offset = -offset
+    if offset & 1 or not _fits_signed(offset, 21):
+        return None
+    return encode_j(offset, rd, entry[1])
+
+
+_FORMAT_ENCODERS: Dict[str, Callable[[Tuple, str], Optional[int]]] = {
+    'R': _encode_r_ops,
+    'I': _encode_i_ops,
+    'SH': _encode_sh_ops,
+    'L': _encode_mem_ops,
+    'S': _encode_mem_ops,
+    'B': _encode_b_ops,
+    'U': _encode_u_ops,
+    'J': _encode_j_ops,
+}
+
+
+# ============================================================================
+# Pseudo-Instruction Expansion
+# ============================================================================
+
+_MASK64 = (1 << 64) - 1
+
+
+@lru_cache(maxsize=8192)
+def _expand_li(rd: int, imm: int) -> Tuple[int, ...]:
+    """
+    Expand `li rd, imm` on RV64 the way GNU as does (load_const in tc-riscv.c)
+
+    Args:
+        rd: Destination register number
+        imm: Signed 64-bit immediate
+
+    Returns:
+        Machine codes of the expanded sequence (all 4-byte instructions)
+    """
+    lower = ((imm & 0xFFF) ^ 0x800) - 0x800
+    # offsetT arithmetic in GNU as: near INT64_MAX the subtraction wraps negative
+    upper = ((imm - lower + (1 << 63)) & _MASK64) - (1 << 63)
+
+    if not _fits_signed(imm, 32):
+        # Reduce to a signed 32-bit constant using SLLI and ADDI
+        shift = 12
+        while not (upper >> shift) & 1:
+            shift += 1
+        codes = _expand_li(rd, upper >> shift)
+        codes += (encode_i(shift, rd, 0b001, rd, _OP_IMM),)
+        if lower:
+            codes += (encode_i(lower, rd, 0b000, rd, _OP_IMM),)
+        return codes
+
+    # LUI and/or ADDI(W) for a signed 32-bit constant
+    codes = ()
+    hi_reg = 0
+    if upper:
+        codes = (encode_u((upper & 0xFFFFFFFF) >> 12, rd, _LUI),)
+        hi_reg = rd
+    if lower or not hi_reg:
+        codes += (encode_i(lower, hi_reg, 0b000, rd, _OP_IMM_32 if hi_reg else _OP_IMM),)
+    return codes
+
+
+def _expand_li_ops(ops: str) -> Optional[Tuple[int, ...]]:
+    m = _U_RE.match(ops)
+    if m is None:
+        return None
+    rd, imm = _reg(m[1]), _imm(m[2])
+    if rd is None or imm is None or not -(1 << 63) <= imm <= _MASK64:
+        return None
+    # Interpret as a 64-bit two's complement value, as the assembler does
+    imm &= _MASK64
+    return _expand_li(rd, imm - (1 << 64) if imm >> 63 else imm)
+
+
+# Pseudo mnemonic -> operand string expander (machine codes or None)
+_PSEUDO_EXPANDERS: Dict[str, Callable[[str], Optional[Tuple[int, ...]]]] = {
+    'li': _expand_li_ops,
+}
+
+
+def supports_march(march: str) -> bool:
+    """
+    Check whether the table encodings are valid for an architecture string
+
+    The table assumes RV64 with the M extension (e.g., 'rv64imac_zicsr', 'rv64gc').
+    """
+    march = march.lower()
+    if not march.startswith('rv64'):
+        return False
+    base = march[4:].split('_', 1)[0]
+    return ('i' in base or 'g' in base) and ('m' in base or 'g' in base)
+
+
+def encode(asm_instruction: str) -> Optional[int]:
+    """
+    Encode an instruction from the built-in table
+
+    Args:
+        asm_instruction: Assembly instruction string (e.g., "add x1, x2, x3")
+
+    Returns:
+        32-bit machine code, or None if the instruction is not covered
+        (unknown mnemonic, non-XPR operand, symbolic or out-of-range immediate)
+    """
+    parts = asm_instruction.split(None, 1)
+    if len(parts) != 2:
+        return None
+
+    entry = MNEMONIC_TABLE.get(parts[0].lower())
+    if entry is None:
+        return None
+
+    return _FORMAT_ENCODERS[entry[0]](entry, parts[1])
+
+
+def encode_sequence(asm_instruction: str) -> Optional[List[Tuple[int, int]]]:
+    """
+    Encode an instruction or supported pseudo-instruction into its full sequence
+
+    Args:
+        asm_instruction: Assembly instruction string (e.g., "li x1, 0x123456789")
+
+    Returns:
+        List of (machine_code, size) tuples as in
+        RiscvCompiler.compile_instruction_sequence, or None if not covered
+    """
+    parts = asm_instruction.split(None, 1)
+    if len(parts) != 2:
+        return None
+
+    expander = _PSEUDO_EXPANDERS.get(parts[0].lower())
+    if expander is not None:
+        codes = expander(parts[1])
+        return None if codes is None else [(code, 4) for code in codes]
+
+    machine_code = encode(asm_instruction)
+    return None if machine_code is None else [(machine_code, 4)]
+
+
+if __name__ == "__main__":
+    def _sext(value: int, bits: int) -> int:
+        value &= (1 << bits) - 1
+        return value - (1 << bits) if value >> (bits - 1) else value
+
+    def _run_li(codes: Tuple[int, ...]) -> int:
+        """Evaluate an expanded li sequence (LUI/ADDI/ADDIW/SLLI only)"""
+        value = 0
+        for code in codes:
+            opcode, rs1 = code & 0x7F, (code >> 15) & 0x1F
+            src = value if rs1 else 0
+            if opcode == _LUI:
+                value = _sext(code & 0xFFFFF000, 32)
+            elif opcode == _OP_IMM_32:
+                value = _sext(src + _sext(code >> 20, 12), 32)
+            elif (code >> 12) & 0x7 == 0b001:
+                value = _sext(src << ((code >> 20) & 0x3F), 64)
+            else:
+                value = _sext(src + _sext(code >> 20, 12), 64)
+        return value
+
+    print("=" * 70)
+    print("Testing li expansion at the 64-bit boundaries")
+    print("=" * 70)
+
+    int64_max, int64_min = (1 << 63) - 1, -(1 << 63)
+    boundary = list(range(int64_max - 2047, int64_max + 1)) + list(range(int64_min, int64_min + 2048))
+    wrong = [imm for imm in boundary if _run_li(_expand_li(10, imm)) != imm]
+    print(f"  {len(boundary) - len(wrong)}/{len(boundary)} boundary values load correctly")
+
+    # GNU as: li a0, 0x7fffffffffffffff -> addi a0,zero,-1; slli a0,a0,63; addi a0,a0,-1
+    expected = tuple(encode(asm) for asm in ("addi x10, x0, -1", "slli x10, x10, 63", "addi x10, x10, -1"))
+    status = "✓" if _expand_li(10, int64_max) == expected else "✗"
+    print(f"  {status} li a0, INT64_MAX matches the GNU as sequence")
@@ -27,11 +27,14 @@ Usage:
     logger.close()
 """
 
-from typing import Optional, List, Dict, Tuple, TYPE_CHECKING
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Tuple, NamedTuple, TYPE_CHECKING
 from pathlib import Path
 import time
 from datetime import datetime
 
+import numpy as np
+
 if TYPE_CHECKING:
     from .spike_session import SpikeSession
 
@@ -107,8 +110,26 @@ CSR_GROUPS = {
     'Vector': [0x008, 0x009, 0x00a, 0x00f, 0xc20, 0xc21, 0xc22],
 }
 
+# Group iteration order and the union of grouped addresses, computed once
+_CSR_GROUP_ITEMS = tuple((name, tuple(addrs)) for name, addrs in CSR_GROUPS.items())
+_GROUPED_CSR_ADDRS = frozenset().union(*CSR_GROUPS.values())
+_GROUPED_CSR_MASK = np.zeros(4096, dtype=bool)
+_GROUPED_CSR_MASK[list(_GROUPED_CSR_ADDRS)] = True
+
+# CSR state as parallel arrays: (addresses as sorted uint16, values as uint64)
+CsrState = Tuple[np.ndarray, np.ndarray]
+
+# Registers always shown in SUMMARY mode: zero, ra, sp, s0, a0, a1
+_SUMMARY_KEY_REGS = frozenset([0, 1, 2, 8, 10, 11])
+
 # Key CSRs to always show in FULL mode (most commonly used)
-KEY_CSRS = [0x300, 0x301, 0x305, 0x341, 0x342, 0x343, 0x003, 0xc20, 0xc21]
+KEY_CSRS = frozenset([0x300, 0x301, 0x305, 0x341, 0x342, 0x343, 0x003, 0xc20, 0xc21])
+
+# Records are buffered and only flushed to the OS every FLUSH_INTERVAL records
+FLUSH_INTERVAL = 256
+
+SEPARATOR = b"-" * 80 + b"\n"
+BANNER = b"=" * 80 + b"\n"
 
 # XPR register names (ABI names)
 XPR_NAMES = [
@@ -126,6 +147,60 @@ FPR_NAMES = [
     "fs8", "fs9", "fs10", "fs11", "ft8", "ft9", "ft10", "ft11"
 ]
 
+# Precomputed cell prefixes for table output ("<name>: 0x", value appended)
+_XPR_CELLS = [f"x{i:2d}/{XPR_NAMES[i]:5s}: 0x" for i in range(32)]
+_FPR_CELLS = [f"f{i:2d}/{FPR_NAMES[i]:5s}: 0x" for i in range(32)]
+
+# CSR addresses are 12 bits: names and cell prefixes are indexed by address
+# (unnamed CSRs show their address)
+_CSR_NAME_LUT = [f"0x{addr:03x}" for addr in range(4096)]
+for _addr, _name in CSR_NAMES.items():
+    _CSR_NAME_LUT[_addr] = _name
+del _addr, _name
+_CSR_CELL_LUT = [f"{name:10s}: 0x" for name in _CSR_NAME_LUT]
+
+
+def _csr_values_at(csrs: CsrState, addrs: List[int]) -> List[int]:
+    """Values of the given CSR addresses (0 for CSRs not present)"""
+    csr_addrs, csr_vals = csrs
+    if not len(csr_addrs):
+        return [0] * len(addrs)
+    pos = np.minimum(np.searchsorted(csr_addrs, addrs), len(csr_addrs) - 1)
+    return np.where(csr_addrs[pos] == addrs, csr_vals[pos], 0).tolist()
+
+
+@dataclass(slots=True)
+class _RegState:
+    """Register snapshot tracked between records (None = not captured)"""
+    xpr: Optional[np.ndarray] = None
+    fpr: Optional[np.ndarray] = None
+    csrs: Optional[CsrState] = None
+    pc: Optional[int] = None
+
+
+class _LogRecord(NamedTuple):
+    """Everything needed to format one instruction record"""
+    index: int
+    instruction: str
+    machine_codes: List[Tuple[int, int]]
+    is_accepted: bool
+    source_regs: Optional[List[int]]
+    source_values: Optional[List[int]]
+    dest_regs: Optional[List[int]]
+    dest_values: Optional[List[int]]
+    xor_value: Optional[int]
+    reject_reason: Optional[str]
+    was_trapped: bool
+    trap_handler_steps: int
+    pre: _RegState
+    xpr: np.ndarray
+    fpr: Optional[np.ndarray]
+    csrs: Optional[CsrState]
+    pc: int
+    xpr_changed: List[int]
+    fpr_changed: List[int]
+    csr_changed: List[int]
+
 
 class SpikeDebugLogger:
     """
@@ -140,7 +215,8 @@ class SpikeDebugLogger:
 
     Output Modes:
     - FULL: Log all state before and after each instruction
-    - DIFF: Log only changed registers/CSRs
+    - DIFF: Log only changed registers/CSRs (back-to-back repeats of the same
+      no-change instruction are collapsed into a single "[SKIPPED ...]" line)
     - SUMMARY: Log only instruction result and key registers
     """
 
@@ -168,149 +244,302 @@ class SpikeDebugLogger:
         self.log_fpr = log_fpr
         self.accepted_only = accepted_only
 
-        # State tracking
+        # Mode-specific behaviour, resolved once instead of per record:
+        # SUMMARY never shows FPRs/CSRs, FULL always reads complete state
+        summary = self.mode == "SUMMARY"
+        self._want_fpr = log_fpr and not summary
+        self._want_csr = log_csr and not summary
+        self._full_reads = self.mode == "FULL"
+        self._diff = self.mode == "DIFF"
+        self._write_state = {
+            "FULL": self._write_full_state,
+            "DIFF": self._write_diff_state,
+            "SUMMARY": self._write_summary_state,
+        }.get(self.mode, self._write_no_state)
+
+        # State tracking: state after the last record and before the current one
         self.instr_counter = 0
-        self.last_xpr: Optional[List[int]] = None
-        self.last_fpr: Optional[List[int]] = None
-        self.last_csrs: Optional[Dict[int, int]] = None
-        self.last_pc: Optional[int] = None
+        self._last = _RegState()
+        self._pre = _RegState()
+
+        # CSR table layout for the current address set (see _csr_layout)
+        self._layout_addrs: Optional[np.ndarray] = None
+        self._layout = None
+
+        # Encoded output of the record being assembled (reused across records)
+        self._rec = bytearray()
 
-        # Pre-execution state (for DIFF mode)
-        self.pre_xpr: Optional[List[int]] = None
-        self.pre_fpr: Optional[List[int]] = None
-        self.pre_csrs: Optional[Dict[int, int]] = None
-        self.pre_pc: Optional[int] = None
+        # DIFF mode run-length state: (instruction, machine codes) of the
+        # previous no-change record and the number of repeats skipped since
+        self._repeat_key: Optional[Tuple[str, List[Tuple[int, int]]]] = None
+        self._repeat_run = 0
 
         # Ensure parent directory exists
         self.filepath.parent.mkdir(parents=True, exist_ok=True)
 
-        # Open file and write header
-        self.file = open(filepath, 'w')
+        # Open file (binary, 1MB buffer) and write header
+        self.file = open(filepath, 'wb', buffering=1 << 20)
         self._write_header()
 
+    def _emit(self):
+        """Write the assembled record to the file in one call"""
+        self.file.write(self._rec)
+        self._rec.clear()
+
+    def _flush_runs(self):
+        """Append a summary line for records skipped since the last written one"""
+        if self._repeat_run:
+            self._rec += f"[SKIPPED {self._repeat_run} repeats of {self._repeat_key[0]}]\n\n".encode()
+            self._repeat_run = 0
+        self._repeat_key = None
+
+    def _coalesce(
+        self,
+        instruction: str,
+        machine_codes: List[Tuple[int, int]],
+        is_accepted: bool,
+        was_trapped: bool,
+        dest_regs: Optional[List[int]],
+        has_changes: bool
+    ) -> bool:
+        """
+        Count a DIFF record into the current run instead of writing it
+
+        Only an accepted, untrapped record that changes no state and writes no
+        register is absorbed, and only when it repeats the instruction and
+        machine code of the record just before it (which was written in full).
+
+        Returns:
+            True if the record was absorbed and must not be written
+        """
+        key = None
+        if is_accepted and not was_trapped and not has_changes and not dest_regs:
+            key = (instruction, machine_codes)
+            if key == self._repeat_key:
+                self._repeat_run += 1
+                return True
+        self._flush_runs()
+        self._repeat_key = key
+        return False
+
+    def flush(self):
+        """Flush buffered output to the OS (for callers that need durability)"""
+        if self.file:
+            self.file.flush()
+
     def _write_header(self):
         """Write file header"""
-        self.file.write("=" * 80 + "\n")
-        self.file.write("  SPIKE DEBUG LOG\n")
-        self.file.write(f"  Generated: {datetime.now().isoformat()}\n")
-        self.file.write(f"  Mode: {self.mode}\n")
-        self.file.write(f"  Log CSR: {self.log_csr}, Log FPR: {self.log_fpr}\n")
-        self.file.write(f"  Filter: {'ACCEPTED only' if self.accepted_only else 'ALL'}\n")
-        self.file.write("=" * 80 + "\n\n")
-
-    def _format_xpr(self, xpr: List[int], changed_indices: Optional[List[int]] = None) -> str:
+        self._rec += BANNER
+        self._rec += b"  SPIKE DEBUG LOG\n"
+        self._rec += f"  Generated: {datetime.now().isoformat()}\n".encode()
+        self._rec += f"  Mode: {self.mode}\n".encode()
+        self._rec += f"  Log CSR: {self.log_csr}, Log FPR: {self.log_fpr}\n".encode()
+        self._rec += f"  Filter: {'ACCEPTED only' if self.accepted_only else 'ALL'}\n".encode()
+        self._rec += BANNER
+        self._rec += b"\n"
+        self._emit()
+
+    @staticmethod
+    def _format_regs(cells: List[str], values: np.ndarray, changed_indices: Optional[List[int]]) -> str:
+        """Format 32 registers, 4 per row, using precomputed cell prefixes"""
+        changed = set(changed_indices) if changed_indices else ()
+        values = values.tolist()
+        parts = [("*" if idx in changed else " ") + cells[idx] + "%016x" % values[idx]
+                 for idx in range(32)]
+        return "\n".join(["  " + "  ".join(parts[i:i + 4]) for i in range(0, 32, 4)])
+
+    def _format_xpr(self, xpr: np.ndarray, changed_indices: Optional[List[int]] = None) -> str:
         """Format XPR registers"""
-        lines = []
-        for i in range(0, 32, 4):
-            row = []
-            for j in range(4):
-                idx = i + j
-                val = xpr[idx]
-                name = f"x{idx:2d}/{XPR_NAMES[idx]:5s}"
-                marker = "*" if (changed_indices and idx in changed_indices) else " "
-                row.append(f"{marker}{name}: 0x{val:016x}")
-            lines.append("  " + "  ".join(row))
-        return "\n".join(lines)
+        return self._format_regs(_XPR_CELLS, xpr, changed_indices)
 
-    def _format_fpr(self, fpr: List[int], changed_indices: Optional[List[int]] = None) -> str:
+    def _format_fpr(self, fpr: np.ndarray, changed_indices: Optional[List[int]] = None) -> str:
         """Format FPR registers"""
-        lines = []
-        for i in range(0, 32, 4):
+        return self._format_regs(_FPR_CELLS, fpr, changed_indices)
+
+    def _csr_layout(self, addrs: np.ndarray):
+        """
+        Positions of the CSRs to show, per group and for ungrouped CSRs
+
+        The CSR address set normally never changes within a session, so the
+        layout is computed once and reused.
+        """
+        if self._layout_addrs is None or not np.array_equal(self._layout_addrs, addrs):
+            pos_of = {addr: pos for pos, addr in enumerate(addrs.tolist())}
+            groups = []
+            for group_name, group_addrs in _CSR_GROUP_ITEMS:
+                members = [(addr, pos_of[addr]) for addr in group_addrs if addr in pos_of]
+                if members:
+                    groups.append((group_name, members))
+            other = [(int(addrs[pos]), int(pos))
+                     for pos in np.flatnonzero(~_GROUPED_CSR_MASK[addrs])]
+            self._layout_addrs = addrs
+            self._layout = (groups, other)
+        return self._layout
+
+    @staticmethod
+    def _format_csr_rows(lines: List[str], members: List[Tuple[int, int]], vals: List[int], changed):
+        """Append CSR cells 3 per row (CSR names are longer than register names)"""
+        for i in range(0, len(members), 3):
             row = []
-            for j in range(4):
-                idx = i + j
-                val = fpr[idx]
-                name = f"f{idx:2d}/{FPR_NAMES[idx]:5s}"
-                marker = "*" if (changed_indices and idx in changed_indices) else " "
-                row.append(f"{marker}{name}: 0x{val:016x}")
+            for addr, pos in members[i:i + 3]:
+                marker = "*" if addr in changed else " "
+                row.append(marker + _CSR_CELL_LUT[addr] + "%016x" % vals[pos])
             lines.append("  " + "  ".join(row))
-        return "\n".join(lines)
 
-    def _format_csrs(self, csrs: Dict[int, int], changed_addrs: Optional[List[int]] = None) -> str:
+    def _format_csrs(self, csrs: CsrState, changed_addrs: Optional[List[int]] = None) -> str:
         """Format CSR values in table format (similar to XPR/FPR)"""
         lines = []
+        changed = set(changed_addrs) if changed_addrs else ()
+        addrs, vals = csrs
+        groups, other = self._csr_layout(addrs)
+        vals = vals.tolist()
 
-        # Format CSRs by group, 3 per row (CSR names are longer than register names)
-        for group_name, group_addrs in CSR_GROUPS.items():
-            # Filter to only CSRs that exist in the dict
-            valid_addrs = [addr for addr in group_addrs if addr in csrs]
-            if not valid_addrs:
-                continue
-
+        # Format CSRs by group
+        for group_name, members in groups:
             lines.append(f"  [{group_name}]")
-            for i in range(0, len(valid_addrs), 3):
-                row = []
-                for j in range(3):
-                    if i + j < len(valid_addrs):
-                        addr = valid_addrs[i + j]
-                        val = csrs[addr]
-                        name = CSR_NAMES.get(addr, f"0x{addr:03x}")
-                        marker = "*" if (changed_addrs and addr in changed_addrs) else " "
-                        row.append(f"{marker}{name:10s}: 0x{val:016x}")
-                lines.append("  " + "  ".join(row))
+            self._format_csr_rows(lines, members, vals, changed)
 
         # Show other CSRs not in groups (if any non-zero)
-        grouped_addrs = set()
-        for addrs in CSR_GROUPS.values():
-            grouped_addrs.update(addrs)
-
-        other_addrs = [addr for addr in sorted(csrs.keys())
-                       if addr not in grouped_addrs and csrs[addr] != 0]
-
-        if other_addrs:
+        other = [(addr, pos) for addr, pos in other if vals[pos] != 0]
+        if other:
             lines.append("  [Other]")
-            for i in range(0, len(other_addrs), 3):
-                row = []
-                for j in range(3):
-                    if i + j < len(other_addrs):
-                        addr = other_addrs[i + j]
-                        val = csrs[addr]
-                        name = CSR_NAMES.get(addr, f"0x{addr:03x}")
-                        marker = "*" if (changed_addrs and addr in changed_addrs) else " "
-                        row.append(f"{marker}{name:10s}: 0x{val:016x}")
-                lines.append("  " + "  ".join(row))
+            self._format_csr_rows(lines, other, vals, changed)
 
         return "\n".join(lines) if lines else "  (no CSRs)"
 
-    def _get_changed_indices(
-        self,
-        old_list: Optional[List[int]],
-        new_list: List[int]
-    ) -> List[int]:
-        """Get indices where values changed"""
-        if old_list is None:
-            return []
-        return [i for i in range(len(new_list)) if old_list[i] != new_list[i]]
-
     def _get_changed_csrs(
         self,
-        old_csrs: Optional[Dict[int, int]],
-        new_csrs: Dict[int, int]
+        old_csrs: Optional[CsrState],
+        new_csrs: CsrState
     ) -> List[int]:
-        """Get CSR addresses where values changed"""
+        """Get CSR addresses where values changed (ascending)"""
         if old_csrs is None:
             return []
-        changed = []
-        for addr, val in new_csrs.items():
-            if addr not in old_csrs or old_csrs[addr] != val:
-                changed.append(addr)
-        return changed
+        old_addrs, old_vals = old_csrs
+        new_addrs, new_vals = new_csrs
+        if np.array_equal(old_addrs, new_addrs):
+            return new_addrs[old_vals != new_vals].tolist()
+        # Address set changed: CSRs that are new or hold a different value
+        new_list = new_addrs.tolist()
+        old_at = _csr_values_at(old_csrs, new_list)
+        present = np.isin(new_addrs, old_addrs).tolist()
+        return [addr for addr, val, old, seen in zip(new_list, new_vals.tolist(), old_at, present)
+                if not seen or old != val]
+
+    def _compute_diffs(
+        self,
+        pre: _RegState,
+        xpr: np.ndarray,
+        fpr: Optional[np.ndarray],
+        csrs: Optional[CsrState],
+        dest_regs: Optional[List[int]]
+    ) -> Tuple[List[int], List[int], List[int]]:
+        """
+        Get changed XPR indices, FPR indices and CSR addresses (all ascending)
+
+        Destination registers are marked as changed even if their value is
+        unchanged, so the log matches spike --log-commits which records all
+        writebacks (register convention: 0-31 = XPR, 32-63 = FPR; x0 never
+        changes).
+        """
+        if pre.xpr is not None:
+            xpr_mask = pre.xpr != xpr
+        else:
+            xpr_mask = np.zeros(32, dtype=bool)
+        fpr_mask = None
+        if fpr is not None:
+            fpr_mask = pre.fpr != fpr if pre.fpr is not None else np.zeros(32, dtype=bool)
+
+        if dest_regs:
+            for reg_idx in dest_regs:
+                if reg_idx < 32:
+                    xpr_mask[reg_idx] = True
+                elif fpr_mask is not None:
+                    fpr_mask[reg_idx - 32] = True
+            xpr_mask[0] = False
+
+        xpr_changed = np.flatnonzero(xpr_mask).tolist()
+        fpr_changed = np.flatnonzero(fpr_mask).tolist() if fpr_mask is not None else []
+        csr_changed = self._get_changed_csrs(pre.csrs, csrs) if csrs is not None and len(csrs[0]) else []
+        return xpr_changed, fpr_changed, csr_changed
+
+    def invalidate(self):
+        """
+        Forget the last logged register state
+
+        Call after executing instructions outside the logger (e.g. loop or
+        jump sequences), so the next record does not diff against stale values.
+        """
+        last = self._last
+        last.xpr = last.fpr = last.csrs = last.pc = None
 
     def capture_pre_state(self, spike_session: 'SpikeSession'):
         """
         Capture state before instruction execution (for DIFF mode)
 
+        The state logged for the previous instruction is still current (only
+        accepted instructions are kept, rejected ones are rolled back), so it
+        is reused as the baseline while the PC has not moved since. Code that
+        runs the engine without logging must call invalidate() afterwards.
+
         Args:
             spike_session: Active SpikeSession instance
         """
-        self.pre_xpr = spike_session.get_all_xpr()
-        self.pre_pc = spike_session.get_current_pc()
+        pre, last = self._pre, self._last
+        pre.pc = spike_session.get_current_pc()
+
+        if last.xpr is not None and last.pc == pre.pc:
+            pre.xpr, pre.fpr, pre.csrs = last.xpr, last.fpr, last.csrs
+            return
+
+        # Stale or missing baseline: the post-state needs full reads as well
+        self.invalidate()
+        pre.xpr = spike_session.get_all_xpr_array()
 
         if self.log_fpr:
-            self.pre_fpr = spike_session.get_all_fpr()
+            pre.fpr = spike_session.get_all_fpr_array()
 
         if self.log_csr:
-            self.pre_csrs = spike_session.get_all_csrs()
+            pre.csrs = spike_session.get_all_csrs_soa()
+
+    def _read_state(
+        self,
+        spike_session: 'SpikeSession',
+        dest_regs: Optional[List[int]],
+        was_trapped: bool
+    ) -> Tuple[np.ndarray, Optional[np.ndarray], Optional[CsrState]]:
+        """
+        Read the post-execution register state needed by the current mode
+
+        In DIFF/SUMMARY mode only the declared destination registers are read
+        and patched into the previous snapshot. Full reads are used for FULL
+        mode, the first instruction, instructions without declared
+        destinations and trapped instructions (the handler may touch anything).
+        CSRs are not declared by instructions, so DIFF mode still reads them
+        all; SUMMARY mode never shows FPRs or CSRs and skips them.
+
+        Returns:
+            Tuple of (xpr, fpr or None, csrs or None)
+        """
+        last = self._last
+        want_fpr = self._want_fpr
+        want_csr = self._want_csr
+
+        if (self._full_reads or not dest_regs or was_trapped or last.xpr is None
+                or (want_fpr and last.fpr is None)):
+            xpr = spike_session.get_all_xpr_array()
+            fpr = spike_session.get_all_fpr_array() if want_fpr else None
+        else:
+            xpr = last.xpr.copy()
+            fpr = last.fpr.copy() if want_fpr else None
+            for reg_idx in dest_regs:
+                if reg_idx < 32:
+                    xpr[reg_idx] = spike_session.get_xpr(reg_idx)
+                elif fpr is not None:
+                    fpr[reg_idx - 32] = spike_session.get_fpr(reg_idx - 32)
+
+        csrs = spike_session.get_all_csrs_soa() if want_csr else None
+        return xpr, fpr, csrs
 
     def log_instruction(
         self,
@@ -351,188 +580,201 @@ class SpikeDebugLogger:
         self.instr_counter += 1
 
         # Get current state
-        curr_xpr = spike_session.get_all_xpr()
+        curr_xpr, curr_fpr, curr_csrs = self._read_state(spike_session, dest_regs, was_trapped)
         curr_pc = spike_session.get_current_pc()
-        curr_fpr = spike_session.get_all_fpr() if self.log_fpr else None
-        curr_csrs = spike_session.get_all_csrs() if self.log_csr else None
 
-        # Calculate changes (value-based detection)
-        xpr_changed = self._get_changed_indices(self.pre_xpr, curr_xpr)
-        fpr_changed = self._get_changed_indices(self.pre_fpr, curr_fpr) if curr_fpr else []
-        csr_changed = self._get_changed_csrs(self.pre_csrs, curr_csrs) if curr_csrs else []
+        # Calculate changes (value-based detection plus destination registers)
+        pre = self._pre
+        xpr_changed, fpr_changed, csr_changed = self._compute_diffs(
+            pre, curr_xpr, curr_fpr, curr_csrs, dest_regs
+        )
+
+        self._write_record(_LogRecord(
+            self.instr_counter, instruction, machine_codes, is_accepted,
+            source_regs, source_values, dest_regs, dest_values, xor_value,
+            reject_reason, was_trapped, trap_handler_steps, pre,
+            curr_xpr, curr_fpr, curr_csrs, curr_pc,
+            xpr_changed, fpr_changed, csr_changed
+        ))
+
+        self._update_last(is_accepted, curr_xpr, curr_fpr, curr_csrs, curr_pc)
+
+    def _write_record(self, record: _LogRecord):
+        """Format and write one instruction record"""
+        (index, instruction, machine_codes, is_accepted,
+         source_regs, source_values, dest_regs, dest_values, xor_value,
+         reject_reason, was_trapped, trap_handler_steps,
+         pre, _, _, _, curr_pc,
+         xpr_changed, fpr_changed, csr_changed) = record
+
+        if self._diff and self._coalesce(
+                instruction, machine_codes, is_accepted, was_trapped, dest_regs,
+                bool(xpr_changed or fpr_changed or csr_changed)):
+            return
 
-        # IMPORTANT: Also mark destination registers as "changed" even if value unchanged
-        # This ensures the log matches spike --log-commits which records all writebacks
-        # Register convention: 0-31 = XPR, 32-63 = FPR
-        if dest_regs:
-            for reg_idx in dest_regs:
-                if reg_idx < 32:
-                    # XPR register
-                    if reg_idx not in xpr_changed and reg_idx != 0:  # x0 never changes
-                        xpr_changed.append(reg_idx)
-                else:
-                    # FPR register (index - 32)
-                    fpr_idx = reg_idx - 32
-                    if fpr_idx not in fpr_changed:
-                        fpr_changed.append(fpr_idx)
-
-        # Write log entry
-        f = self.file
+        # Assemble log entry
+        rec = self._rec
 
         # Header with trap status
         status = "ACCEPTED" if is_accepted else "REJECTED"
         trap_suffix = ""
         if was_trapped:
             trap_suffix = f" [TRAPPED: {trap_handler_steps} steps]"
-        f.write("-" * 80 + "\n")
-        f.write(f"[#{self.instr_counter:06d}] [{status}]{trap_suffix} {instruction}\n")
-        f.write("-" * 80 + "\n")
+        rec += SEPARATOR
+        rec += f"[#{index:06d}] [{status}]{trap_suffix} {instruction}\n".encode()
+        rec += SEPARATOR
 
         # Machine code info
         if len(machine_codes) == 1:
             mc, sz = machine_codes[0]
-            f.write(f"  Machine Code: 0x{mc:08x} (size={sz})\n")
+            rec += f"  Machine Code: 0x{mc:08x} (size={sz})\n".encode()
         else:
-            f.write(f"  Machine Code (expanded to {len(machine_codes)} instructions):\n")
+            rec += f"  Machine Code (expanded to {len(machine_codes)} instructions):\n".encode()
             for i, (mc, sz) in enumerate(machine_codes):
-                f.write(f"    [{i}] 0x{mc:08x} (size={sz})\n")
+                rec += f"    [{i}] 0x{mc:08x} (size={sz})\n".encode()
 
         # PC info
-        if self.pre_pc is not None:
-            f.write(f"  PC: 0x{self.pre_pc:016x} -> 0x{curr_pc:016x}\n")
+        if pre.pc is not None:
+            rec += f"  PC: 0x{pre.pc:016x} -> 0x{curr_pc:016x}\n".encode()
         else:
-            f.write(f"  PC: 0x{curr_pc:016x}\n")
+            rec += f"  PC: 0x{curr_pc:016x}\n".encode()
 
         # Source/Dest registers (from validator)
         if source_regs and source_values:
             src_info = ", ".join([f"r{r}=0x{v:x}" for r, v in zip(source_regs, source_values)])
-            f.write(f"  Source: [{src_info}]\n")
+            rec += f"  Source: [{src_info}]\n".encode()
 
         if dest_regs and dest_values:
             dst_info = ", ".join([f"r{r}=0x{v:x}" for r, v in zip(dest_regs, dest_values)])
-            f.write(f"  Dest:   [{dst_info}]\n")
+            rec += f"  Dest:   [{dst_info}]\n".encode()
 
         if xor_value is not None:
-            f.write(f"  XOR Value: 0x{xor_value:016x}\n")
+            rec += f"  XOR Value: 0x{xor_value:016x}\n".encode()
 
         if reject_reason:
-            f.write(f"  Reject Reason: {reject_reason}\n")
+            rec += f"  Reject Reason: {reject_reason}\n".encode()
 
-        f.write("\n")
+        rec += b"\n"
 
         # Full state based on mode
-        if self.mode == "FULL":
-            self._write_full_state(f, curr_xpr, curr_fpr, curr_csrs, xpr_changed, fpr_changed, csr_changed)
-        elif self.mode == "DIFF":
-            self._write_diff_state(f, curr_xpr, curr_fpr, curr_csrs, xpr_changed, fpr_changed, csr_changed)
-        elif self.mode == "SUMMARY":
-            self._write_summary_state(f, curr_xpr, xpr_changed)
-
-        f.write("\n")
-        f.flush()
-
-        # Update last state
-        self.last_xpr = curr_xpr
-        self.last_fpr = curr_fpr
-        self.last_csrs = curr_csrs
-        self.last_pc = curr_pc
-
-    def _write_full_state(
+        self._write_state(record)
+
+        rec += b"\n"
+        self._emit()
+        if index % FLUSH_INTERVAL == 0:
+            self.file.flush()
+
+    def _update_last(
         self,
-        f,
-        xpr: List[int],
-        fpr: Optional[List[int]],
-        csrs: Optional[Dict[int, int]],
-        xpr_changed: List[int],
-        fpr_changed: List[int],
-        csr_changed: List[int]
+        is_accepted: bool,
+        xpr: np.ndarray,
+        fpr: Optional[np.ndarray],
+        csrs: Optional[CsrState],
+        pc: int
     ):
+        """
+        Update last state (a rejected instruction is rolled back by the
+        caller, so its state must not become the next baseline)
+        """
+        last = self._last
+        if is_accepted:
+            last.xpr, last.fpr, last.csrs = xpr, fpr, csrs
+        else:
+            last.xpr = last.fpr = last.csrs = None
+        last.pc = pc
+
+    def _write_full_state(self, record: _LogRecord):
         """Write full state (FULL mode)"""
-        f.write("  [Integer Registers (XPR)] (* = changed)\n")
-        f.write(self._format_xpr(xpr, xpr_changed) + "\n\n")
+        xpr, fpr, csrs = record.xpr, record.fpr, record.csrs
+        xpr_changed, fpr_changed, csr_changed = record.xpr_changed, record.fpr_changed, record.csr_changed
+        rec = self._rec
+        rec += b"  [Integer Registers (XPR)] (* = changed)\n"
+        rec += self._format_xpr(xpr, xpr_changed).encode()
+        rec += b"\n\n"
 
         if fpr is not None:
-            f.write("  [Floating-Point Registers (FPR)] (* = changed)\n")
-            f.write(self._format_fpr(fpr, fpr_changed) + "\n\n")
+            rec += b"  [Floating-Point Registers (FPR)] (* = changed)\n"
+            rec += self._format_fpr(fpr, fpr_changed).encode()
+            rec += b"\n\n"
 
         if csrs is not None:
-            f.write("  [Control and Status Registers (CSR)] (* = changed)\n")
-            f.write(self._format_csrs(csrs, csr_changed) + "\n")
+            rec += b"  [Control and Status Registers (CSR)] (* = changed)\n"
+            rec += self._format_csrs(csrs, csr_changed).encode()
+            rec += b"\n"
 
-    def _write_diff_state(
-        self,
-        f,
-        xpr: List[int],
-        fpr: Optional[List[int]],
-        csrs: Optional[Dict[int, int]],
-        xpr_changed: List[int],
-        fpr_changed: List[int],
-        csr_changed: List[int]
-    ):
+    def _write_diff_state(self, record: _LogRecord):
         """Write only changed state (DIFF mode) - compact format"""
+        pre, xpr, fpr, csrs = record.pre, record.xpr, record.fpr, record.csrs
+        xpr_changed, fpr_changed, csr_changed = record.xpr_changed, record.fpr_changed, record.csr_changed
         has_changes = False
 
         if xpr_changed:
             has_changes = True
             changes = []
             for idx in xpr_changed:
-                old_val = self.pre_xpr[idx] if self.pre_xpr else 0
-                new_val = xpr[idx]
+                old_val = int(pre.xpr[idx]) if pre.xpr is not None else 0
+                new_val = int(xpr[idx])
                 name = XPR_NAMES[idx]
                 changes.append(f"{name}: {old_val:x}->{new_val:x}")
-            f.write(f"  XPR: {', '.join(changes)}\n")
+            self._rec += f"  XPR: {', '.join(changes)}\n".encode()
 
         if fpr_changed and fpr is not None:
             has_changes = True
             changes = []
             for idx in fpr_changed:
-                old_val = self.pre_fpr[idx] if self.pre_fpr else 0
-                new_val = fpr[idx]
+                old_val = int(pre.fpr[idx]) if pre.fpr is not None else 0
+                new_val = int(fpr[idx])
                 name = FPR_NAMES[idx]
                 changes.append(f"{name}: {old_val:x}->{new_val:x}")
-            f.write(f"  FPR: {', '.join(changes)}\n")
+            self._rec += f"  FPR: {', '.join(changes)}\n".encode()
 
         if csr_changed and csrs is not None:
             has_changes = True
-            changes = []
-            for addr in csr_changed:
-                old_val = self.pre_csrs.get(addr, 0) if self.pre_csrs else 0
-                new_val = csrs[addr]
-                name = CSR_NAMES.get(addr, f"0x{addr:03x}")
-                changes.append(f"{name}: {old_val:x}->{new_val:x}")
-            f.write(f"  CSR: {', '.join(changes)}\n")
+            new_vals = _csr_values_at(csrs, csr_changed)
+            if pre.csrs is not None:
+                old_vals = _csr_values_at(pre.csrs, csr_changed)
+            else:
+                old_vals = [0] * len(csr_changed)
+            changes = [f"{_CSR_NAME_LUT[addr]}: {old_val:x}->{new_val:x}"
+                       for addr, old_val, new_val in zip(csr_changed, old_vals, new_vals)]
+            self._rec += f"  CSR: {', '.join(changes)}\n".encode()
 
         if not has_changes:
-            f.write("  (no changes)\n")
+            self._rec += b"  (no changes)\n"
 
-    def _write_summary_state(self, f, xpr: List[int], xpr_changed: List[int]):
+    def _write_summary_state(self, record: _LogRecord):
         """Write summary state (SUMMARY mode)"""
+        xpr, xpr_changed = record.xpr, record.xpr_changed
         # Only show key registers and changed ones
-        key_regs = [0, 1, 2, 8, 10, 11]  # zero, ra, sp, s0, a0, a1
-        show_regs = set(key_regs) | set(xpr_changed)
+        show_regs = _SUMMARY_KEY_REGS.union(xpr_changed)
 
-        f.write("  [Key Registers]\n")
+        rec = self._rec
+        rec += b"  [Key Registers]\n"
         for idx in sorted(show_regs):
             name = f"x{idx}/{XPR_NAMES[idx]}"
             marker = "*" if idx in xpr_changed else " "
-            f.write(f"  {marker}{name:12s}: 0x{xpr[idx]:016x}\n")
+            rec += f"  {marker}{name:12s}: 0x{int(xpr[idx]):016x}\n".encode()
+
+    def _write_no_state(self, record: _LogRecord):
+        """Unknown mode: records carry no register state"""
 
     def log_exception(self, instruction: str, exception: Exception):
         """Log exception during instruction execution"""
         self.instr_counter += 1
 
-        f = self.file
-        f.write("-" * 80 + "\n")
-        f.write(f"[#{self.instr_counter:06d}] [EXCEPTION] {instruction}\n")
-        f.write("-" * 80 + "\n")
-        f.write(f"  Exception: {type(exception).__name__}: {exception}\n")
-        f.write("\n")
-        f.flush()
+        self._flush_runs()
+        self._rec += SEPARATOR
+        self._rec += f"[#{self.instr_counter:06d}] [EXCEPTION] {instruction}\n".encode()
+        self._rec += SEPARATOR
+        self._rec += f"  Exception: {type(exception).__name__}: {exception}\n".encode()
+        self._rec += b"\n"
+        self._emit()
 
     def log_custom(self, message: str):
         """Log a custom message"""
-        self.file.write(f"[INFO] {message}\n")
-        self.file.flush()
+        self._flush_runs()
+        self._rec += f"[INFO] {message}\n".encode()
+        self._emit()
 
     def get_stats(self) -> Dict[str, int]:
         """Get logging statistics"""
@@ -543,9 +785,12 @@ class SpikeDebugLogger:
     def close(self):
         """Close the log file"""
         if self.file:
-            self.file.write("\n" + "=" * 80 + "\n")
-            self.file.write(f"  END OF LOG - Total instructions: {self.instr_counter}\n")
-            self.file.write("=" * 80 + "\n")
+            self._flush_runs()
+            self._rec += b"\n"
+            self._rec += BANNER
+            self._rec += f"  END OF LOG - Total instructions: {self.instr_counter}\n".encode()
+            self._rec += BANNER
+            self._emit()
             self.file.close()
             self.file = None
 
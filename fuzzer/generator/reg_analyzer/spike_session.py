@@ -23,12 +23,19 @@ Simplified API (v3.0):
 """
 
 import sys
+import logging
+import traceback
 from pathlib import Path
 from typing import Optional, List, Tuple
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
 # Add spike_engine path
-SPIKE_ENGINE_PATH = Path(__file__).parent.parent.parent.parent / "ref" / "riscv-isa-sim-adapter" / "spike_engine"
-sys.path.insert(0, str(SPIKE_ENGINE_PATH))
+SPIKE_ENGINE_PATH = Path(__file__).parents[3] / "ref" / "riscv-isa-sim-adapter" / "spike_engine"
+if str(SPIKE_ENGINE_PATH) not in sys.path:
+    sys.path.insert(0, str(SPIKE_ENGINE_PATH))
 
 try:
     import spike_engine
@@ -62,6 +69,11 @@ except ImportError as e:
     print()
 
 
+def _not_initialized(*args, **kwargs):
+    """Stand-in for engine methods until SpikeSession.initialize() succeeds"""
+    raise RuntimeError("Session not initialized. Call initialize() first.")
+
+
 class SpikeSession:
     """
     Spike session manager with checkpoint support
@@ -83,6 +95,11 @@ class SpikeSession:
     Performance: O(n) instead of O(n^2) for n instructions
     """
 
+    __slots__ = (
+        'elf_path', 'isa', 'num_instrs', 'engine', 'checkpoint_set', 'initialized',
+        '_execute', '_set_checkpoint', '_restore_checkpoint', '_get_pc', '_get_xpr', '_get_fpr'
+    )
+
     def __init__(self, elf_path: str, isa: str, num_instrs: int):
         """
         Create Spike session
@@ -112,6 +129,33 @@ class SpikeSession:
         self.checkpoint_set: bool = False
         self.initialized: bool = False
 
+        # Bound engine methods for the hot path (see _bind_engine)
+        self._unbind_engine()
+
+    def _bind_engine(self):
+        """
+        Cache bound engine methods used on every instruction
+
+        Saves the self.engine attribute and method lookups per call; the
+        initialized check is folded in, since the unbound stand-ins raise.
+        """
+        engine = self.engine
+        self._execute = engine.execute_sequence
+        self._set_checkpoint = engine.set_checkpoint
+        self._restore_checkpoint = engine.restore_checkpoint
+        self._get_pc = engine.get_pc
+        self._get_xpr = engine.get_xpr
+        self._get_fpr = engine.get_fpr
+
+    def _unbind_engine(self):
+        """Point the hot-path methods back at the not-initialized stand-in"""
+        self._execute = _not_initialized
+        self._set_checkpoint = _not_initialized
+        self._restore_checkpoint = _not_initialized
+        self._get_pc = _not_initialized
+        self._get_xpr = _not_initialized
+        self._get_fpr = _not_initialized
+
     def initialize(self) -> bool:
         """
         Initialize Spike engine and execute template initialization
@@ -142,12 +186,12 @@ class SpikeSession:
                 print(f"[SpikeSession] Initialization failed: {error_msg}")
                 return False
 
+            self._bind_engine()
             self.initialized = True
             return True
 
         except Exception as e:
             print(f"[SpikeSession] Exception during initialization: {e}")
-            import traceback
             traceback.print_exc()
             return False
 
@@ -176,21 +220,15 @@ class SpikeSession:
         Raises:
             RuntimeError: If session not initialized or execution fails
         """
-        if not self.initialized:
-            raise RuntimeError("Session not initialized. Call initialize() first.")
-
         try:
-            return self.engine.execute_sequence(machine_codes, sizes, max_steps)
+            return self._execute(machine_codes, sizes, max_steps)
         except Exception as e:
-            # Debug output for execution failures
-            pc = self.engine.get_pc() if self.engine else 0
-            print(f"\n[SpikeSession] execute_sequence FAILED:")
-            print(f"  PC: 0x{pc:x}")
-            print(f"  Codes: {[f'0x{c:08x}' for c in machine_codes]}")
-            print(f"  Sizes: {sizes}")
-            print(f"  Error: {e}")
-            import traceback
-            traceback.print_exc()
+            if self.initialized:
+                self._report_failure(
+                    "execute_sequence", e,
+                    Codes=[f'0x{c:08x}' for c in machine_codes],
+                    Sizes=sizes
+                )
             raise
 
     def execute_single(self, machine_code: int, size: Optional[int] = None) -> int:
@@ -205,7 +243,8 @@ class SpikeSession:
             Number of steps executed (typically 1)
         """
         if size is None:
-            size = spike_engine.SpikeEngine.get_instruction_size(machine_code)
+            # bits[1:0] != 0b11 -> 16-bit compressed, else 32-bit
+            size = 2 if (machine_code & 0x3) != 0x3 else 4
         return self.execute_sequence([machine_code], [size])
 
     def set_checkpoint(self):
@@ -214,18 +253,12 @@ class SpikeSession:
 
         Call this before executing instructions that may need to be rolled back.
         """
-        if not self.initialized:
-            raise RuntimeError("Session not initialized")
         try:
-            self.engine.set_checkpoint()
+            self._set_checkpoint()
             self.checkpoint_set = True
         except Exception as e:
-            pc = self.engine.get_pc() if self.engine else 0
-            print(f"\n[SpikeSession] set_checkpoint FAILED:")
-            print(f"  PC: 0x{pc:x}")
-            print(f"  Error: {e}")
-            import traceback
-            traceback.print_exc()
+            if self.initialized:
+                self._report_failure("set_checkpoint", e)
             raise
 
     def confirm_instruction(self):
@@ -247,21 +280,35 @@ class SpikeSession:
             - Restores processor state to last checkpoint
             - Resets checkpoint_set flag
         """
-        if not self.initialized:
-            raise RuntimeError("Session not initialized")
-
         try:
-            self.engine.restore_checkpoint()
+            self._restore_checkpoint()
             self.checkpoint_set = False
         except Exception as e:
-            pc = self.engine.get_pc() if self.engine else 0
-            print(f"\n[SpikeSession] restore_checkpoint_and_reset FAILED:")
-            print(f"  PC: 0x{pc:x}")
-            print(f"  Error: {e}")
-            import traceback
-            traceback.print_exc()
+            if self.initialized:
+                self._report_failure("restore_checkpoint_and_reset", e)
             raise
 
+    def _report_failure(self, operation: str, error: Exception, **details):
+        """
+        Log diagnostics for a failed engine call at DEBUG level
+
+        Kept out of line so the execute/checkpoint methods stay small; the
+        caller re-raises. Nothing is formatted unless DEBUG is enabled, so a
+        burst of failing candidates does not turn into a burst of tracebacks.
+
+        Args:
+            operation: Name of the failing SpikeSession method
+            error: The exception raised by the engine
+            **details: Extra "Label: value" lines logged after the PC
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+        pc = self.engine.get_pc() if self.engine else 0
+        lines = [f"[SpikeSession] {operation} FAILED:", f"  PC: 0x{pc:x}"]
+        lines.extend(f"  {label}: {value}" for label, value in details.items())
+        lines.append(f"  Error: {error}")
+        logger.debug("\n".join(lines), exc_info=True)
+
     def get_current_pc(self) -> int:
         """
         Get current program counter
@@ -272,9 +319,7 @@ class SpikeSession:
         Raises:
             RuntimeError: If session not initialized
         """
-        if not self.initialized:
-            raise RuntimeError("Session not initialized")
-        return self.engine.get_pc()
+        return self._get_pc()
 
     def get_xpr(self, reg_index: int) -> int:
         """
@@ -289,9 +334,7 @@ class SpikeSession:
         Raises:
             RuntimeError: If session not initialized
         """
-        if not self.initialized:
-            raise RuntimeError("Session not initialized")
-        return self.engine.get_xpr(reg_index)
+        return self._get_xpr(reg_index)
 
     def get_fpr(self, reg_index: int) -> int:
         """
@@ -306,9 +349,27 @@ class SpikeSession:
         Raises:
             RuntimeError: If session not initialized
         """
-        if not self.initialized:
-            raise RuntimeError("Session not initialized")
-        return self.engine.get_fpr(reg_index)
+        return self._get_fpr(reg_index)
+
+    def read_registers(self, reg_indices: List[int]) -> List[int]:
+        """
+        Get register values by unified index
+
+        Uses the bound engine getters directly for the whole list, instead
+        of a get_xpr/get_fpr call chain per register.
+
+        Args:
+            reg_indices: Register indices (0-31 = XPR, 32-63 = FPR)
+
+        Returns:
+            List of register values in the same order
+
+        Raises:
+            RuntimeError: If session not initialized
+        """
+        get_xpr = self._get_xpr
+        get_fpr = self._get_fpr
+        return [get_xpr(r) if r < 32 else get_fpr(r - 32) for r in reg_indices]
 
     def get_all_xpr(self) -> List[int]:
         """
@@ -322,7 +383,8 @@ class SpikeSession:
         """
         if not self.initialized:
             raise RuntimeError("Session not initialized")
-        return list(self.engine.get_all_xpr())
+        values = self.engine.get_all_xpr()
+        return values if type(values) is list else list(values)
 
     def get_all_fpr(self) -> List[int]:
         """
@@ -336,7 +398,36 @@ class SpikeSession:
         """
         if not self.initialized:
             raise RuntimeError("Session not initialized")
-        return list(self.engine.get_all_fpr())
+        values = self.engine.get_all_fpr()
+        return values if type(values) is list else list(values)
+
+    def get_all_xpr_array(self) -> np.ndarray:
+        """
+        Get all general-purpose register values as a uint64 array
+
+        Returns:
+            Array of 32 register values (x0-x31)
+
+        Raises:
+            RuntimeError: If session not initialized
+        """
+        if not self.initialized:
+            raise RuntimeError("Session not initialized")
+        return np.array(self.engine.get_all_xpr(), dtype=np.uint64)
+
+    def get_all_fpr_array(self) -> np.ndarray:
+        """
+        Get all floating-point register values as a uint64 array
+
+        Returns:
+            Array of 32 register values (f0-f31)
+
+        Raises:
+            RuntimeError: If session not initialized
+        """
+        if not self.initialized:
+            raise RuntimeError("Session not initialized")
+        return np.array(self.engine.get_all_fpr(), dtype=np.uint64)
 
     def get_csr(self, csr_addr: int) -> int:
         """
@@ -367,7 +458,26 @@ class SpikeSession:
         """
         if not self.initialized:
             raise RuntimeError("Session not initialized")
-        return dict(self.engine.get_all_csrs())
+        csrs = self.engine.get_all_csrs()
+        # pybind11 already converts the map into a fresh dict; only copy other mappings
+        return csrs if type(csrs) is dict else dict(csrs)
+
+    def get_all_csrs_soa(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get all accessible CSR values as parallel arrays
+
+        Returns:
+            Tuple of (addresses as sorted uint16 array, values as uint64 array)
+
+        Raises:
+            RuntimeError: If session not initialized
+        """
+        if not self.initialized:
+            raise RuntimeError("Session not initialized")
+        csrs = self.engine.get_all_csrs()
+        addrs = sorted(csrs)
+        return (np.array(addrs, dtype=np.uint16),
+                np.array([csrs[addr] for addr in addrs], dtype=np.uint64))
 
     def get_mem_region_info(self) -> Tuple[int, int]:
         """
@@ -460,6 +570,7 @@ class SpikeSession:
         Should be called when session is no longer needed.
         Note: With shared cache mode, no need to save cache (already in shared memory).
         """
+        self._unbind_engine()
         self.engine = None
         self.initialized = False
         self.checkpoint_set = False
@@ -40,7 +40,7 @@ import hashlib
 import math
 import os
 from multiprocessing import shared_memory
-from typing import Optional
+from typing import Dict, Optional, Set
 
 
 def compute_xor(values: list) -> int:
@@ -51,7 +51,27 @@ def compute_xor(values: list) -> int:
     This ensures different orderings produce different results:
         [A, B] -> A ^ (B << 1)
         [B, A] -> B ^ (A << 1)  (different result)
+
+    Operand lists are short (source registers plus an optional immediate), so
+    the common lengths are unrolled. Values are Python ints: immediates can be
+    negative and the shifted result can exceed 64 bits, so this must not be
+    done in fixed-width (e.g. numpy uint64) arithmetic.
     """
+    n = len(values)
+    if n == 2:
+        v0, v1 = values
+        return v0 ^ (v1 << 1)
+    if n == 3:
+        v0, v1, v2 = values
+        return v0 ^ (v1 << 1) ^ (v2 << 2)
+    if n == 1:
+        return values[0]
+    if n == 4:
+        v0, v1, v2, v3 = values
+        return v0 ^ (v1 << 1) ^ (v2 << 2) ^ (v3 << 3)
+    if n == 5:
+        v0, v1, v2, v3, v4 = values
+        return v0 ^ (v1 << 1) ^ (v2 << 2) ^ (v3 << 3) ^ (v4 << 4)
     result = 0
     for i, value in enumerate(values):
         result ^= (value << i)
@@ -95,6 +115,11 @@ class XORCache:
         self._buffer: Optional[memoryview] = None
         self._owner = False
 
+        # Values this process already queried, per opcode (see check_and_add)
+        self._seen: Dict[str, Set[int]] = {}
+        # Hash state with the "<opcode>:" key prefix already absorbed
+        self._hashers = {}
+
     @classmethod
     def create_for_workload(
         cls,
@@ -149,6 +174,8 @@ class XORCache:
         instance._shm = None
         instance._buffer = None
         instance._owner = False
+        instance._seen = {}
+        instance._hashers = {}
 
         return instance
 
@@ -156,7 +183,7 @@ class XORCache:
         """
         Create shared memory region (call from main process only).
 
-        This allocates the shared memory and initializes all bits to 0.
+        This allocates the shared memory with all bits 0.
         Worker processes should call attach() instead.
         """
         # Clean up any existing shared memory with same name
@@ -174,10 +201,11 @@ class XORCache:
         )
         self._buffer = memoryview(self._shm.buf)
         self._owner = True
+        self._seen = {}
 
-        # Clear all bits (initialize to empty)
-        for i in range(self._size_bytes):
-            self._buffer[i] = 0
+        # No explicit clear: a newly created segment is already zero-filled
+        # (POSIX shm_open + ftruncate, Windows pagefile-backed mapping), and
+        # writing it would fault in every page of the filter up front
 
     def attach(self):
         """
@@ -188,13 +216,16 @@ class XORCache:
         self._shm = shared_memory.SharedMemory(name=self._name)
         self._buffer = memoryview(self._shm.buf)
         self._owner = False
+        self._seen = {}
 
     def _hash_positions(self, opcode: str, value: int) -> list:
         """
         Compute k bit positions for a (opcode, value) pair.
 
-        Uses SHA256 with different salts to generate independent hash functions.
-        Each hash maps to a position in the bit array.
+        Uses double hashing (Kirsch-Mitzenmacher): one 128-bit BLAKE2b digest
+        is split into h1 and h2, and position i is (h1 + i * h2) mod m. This
+        keeps the false positive rate of k independent hashes at the cost of
+        a single digest.
 
         Args:
             opcode: Instruction opcode (e.g., "add", "sub")
@@ -203,17 +234,16 @@ class XORCache:
         Returns:
             List of k bit positions
         """
-        positions = []
-        key = f"{opcode}:{value}".encode()
-
-        for i in range(self._num_hashes):
-            # SHA256 with salt for different hash functions
-            h = hashlib.sha256(key + i.to_bytes(1, 'little')).digest()
-            # Use first 8 bytes as position, mod by filter size
-            pos = int.from_bytes(h[:8], 'little') % self._size_bits
-            positions.append(pos)
-
-        return positions
+        base = self._hashers.get(opcode)
+        if base is None:
+            base = self._hashers[opcode] = hashlib.blake2b(f"{opcode}:".encode(), digest_size=16)
+        h = base.copy()
+        h.update(str(value).encode())
+        h = h.digest()
+        h1 = int.from_bytes(h[:8], 'little')
+        h2 = int.from_bytes(h[8:], 'little') | 1  # odd step: never stuck on one bit
+        size_bits = self._size_bits
+        return [(h1 + i * h2) % size_bits for i in range(self._num_hashes)]
 
     def _check(self, opcode: str, value: int) -> bool:
         """
@@ -240,14 +270,32 @@ class XORCache:
         """
         Check if XOR is unique and add it atomically.
 
+        Bits are never cleared, so once a value has been checked every later
+        check of it fails. Values this process already checked are kept in a
+        local set and rejected without hashing.
+
         Returns:
             True if value was unique (added), False if possibly duplicate
         """
         if self._buffer is None:
             return True  # Not initialized, allow everything
-        if self._check(opcode, xor_value):
-            return False  # Possibly exists -> duplicate
-        self._add(opcode, xor_value)
+        seen = self._seen.get(opcode)
+        if seen is None:
+            seen = self._seen[opcode] = set()
+        elif xor_value in seen:
+            return False  # Checked before by this process -> duplicate
+        seen.add(xor_value)
+
+        # Hash once for both the membership test and the insert
+        positions = self._hash_positions(opcode, xor_value)
+        buffer = self._buffer
+        for pos in positions:
+            if not (buffer[pos >> 3] & (1 << (pos & 7))):
+                break
+        else:
+            return False  # All bits set -> possibly exists -> duplicate
+        for pos in positions:
+            buffer[pos >> 3] |= (1 << (pos & 7))
         return True  # Definitely new -> unique
 
     def is_unique(self, opcode: str, source_values: list) -> tuple:
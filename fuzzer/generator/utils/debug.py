@@ -14,12 +14,10 @@
 # For debugging purposes
 def write_freq_analysis_to_file(instruction_freq, output_filename):
     with open(output_filename, 'w') as file:
-        for instr, count in instruction_freq.items():
-            file.write(f"{instr}: {count}\n")
+        file.writelines(f"{instr}: {count}\n" for instr, count in instruction_freq.items())
             
             
 # For debugging purposes
 def write_queue_to_file(queue, output_filename):
     with open(output_filename, 'w') as file:
-        for instr in queue:
-            file.write(f"{instr}\n")
+        file.writelines(f"{instr}\n" for instr in queue)
@@ -44,9 +44,7 @@ def remove_lines_and_count(input_file, output_file):
                 following_line = lines[i+1].strip()
                 if following_line:  
                     first_word = following_line.split()[0]
-                    if first_word not in following_word_counts:
-                        following_word_counts[first_word] = 0
-                    following_word_counts[first_word] += 1
+                    following_word_counts[first_word] = following_word_counts.get(first_word, 0) + 1
     
     filtered_lines = [line for line in lines \
             if not any(line.startswith(prefix) \